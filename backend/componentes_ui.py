@@ -2,7 +2,10 @@
 Módulo de componentes de interface do usuário.
 Refatorado para incluir layout horizontal de horários conforme especificação de design.
 """
+import calendar
 import logging
+import struct
+from collections import defaultdict
 from typing import Dict, Tuple, Optional, List
 from datetime import date, timedelta
 from PyQt6.QtWidgets import (
@@ -11,37 +14,127 @@ from PyQt6.QtWidgets import (
     QMenu, QComboBox, QLineEdit, QDialogButtonBox, QMessageBox, QSpinBox,
     QPushButton, QGridLayout, QFrame, QCalendarWidget, QScrollArea
 )
-from PyQt6.QtCore import Qt, QMimeData, pyqtSignal, QTimer, QPoint, pyqtProperty, QPropertyAnimation, QEasingCurve, QDate
-from PyQt6.QtGui import QDrag, QAction, QFont, QColor, QPainter, QPen, QTextCharFormat, QBrush
+from PyQt6.QtCore import (
+    Qt, QMimeData, pyqtSignal, QTimer, QPoint, QRect, QByteArray, pyqtProperty,
+    QPropertyAnimation, QEasingCurve, QDate
+)
+from PyQt6.QtGui import (
+    QDrag, QAction, QFont, QColor, QPainter, QPen, QTextCharFormat, QBrush,
+    QStandardItemModel, QStandardItem
+)
 
 from dominio import (
-    DiaDaSemana, StatusTarefa, Prioridade, Periodicidade,
+    DiaDaSemana, DIAS_DA_SEMANA, DIAS_DA_SEMANA_VALORES,
+    StatusTarefa, Prioridade, Periodicidade,
     converter_string_para_dia, converter_string_para_status,
     ExtratorMetadados, MetadadosAtividade
 )
 from servicos import ServicoTarefas, ServicoHorarios
+from workers import executar_async
 from animacoes import aplicar_sombra, fade_in
 from constantes import (
     LARGURA_DIALOGO_TAREFA, ALTURA_DIALOGO_TAREFA, LARGURA_DIALOGO_HORARIO,
     ALTURA_DIALOGO_HORARIO, DESFOQUE_SOMBRA_DIALOGO, DESLOCAMENTO_Y_SOMBRA_DIALOGO,
     COR_SOMBRA_DIALOGO, ATRASO_FADE_DIALOGO, DURACAO_FADE_DIALOGO,
     HORARIO_INICIAL_SPINBOX, MINUTO_INICIAL_SPINBOX, LARGURA_MINIMA_SPINBOX,
-    ALTURA_MINIMA_SPINBOX, ALTURA_MINIMA_LISTA, ESTILO_BOTAO_ADICIONAR_HORARIO,
-    ESTILO_LABEL_PREVIA_HORARIO, ESTILO_SPINBOX, ESTILO_TITULO_DIALOGO,
-    ESTILO_ROTULO_STATUS, DURACAO_RIPPLE,
-    ESTILO_DIALOGO_TITULO, ESTILO_DIALOGO_LABEL_INPUT, ESTILO_DIALOGO_BOX_PREVIA,
+    ALTURA_MINIMA_SPINBOX, ALTURA_MINIMA_LISTA,
+    DURACAO_RIPPLE, ESTILO_DIALOGO_COMBINADO,
     CORES_PRIORIDADE_VIBRANTE, CORES_PRIORIDADE_SUAVE, NOMES_PRIORIDADE,
     DESCRICOES_PRIORIDADE, NOMES_PERIODICIDADE, LISTA_PERIODICIDADES,
     INDICE_PERIODICIDADE,
-    MSG_TITULO_OBRIGATORIO, MSG_ERRO_ATUALIZAR_HORARIO, MSG_ERRO_EDITAR_HORARIO,
+    MSG_TITULO_OBRIGATORIO, MSG_ERRO_ATUALIZAR_HORARIO,
     MSG_ERRO_REMOVER_HORARIO, MSG_CONFIRMAR_EXCLUSAO_HORARIO,
     MSG_CONFIRMAR_DELETAR_TAREFA, MSG_NENHUMA_ATIVIDADE, MSG_FIM_DE_SEMANA,
-    TOOLTIP_TAREFA_AGENDA, TOOLTIP_TAREFA_MANUAL, TOOLTIP_ATIVIDADE,
+    TOOLTIP_TAREFA_AGENDA_POR_PRIO, TOOLTIP_TAREFA_MANUAL_POR_PRIO,
+    montar_tooltip_atividade,
     TOOLTIP_SINCRONIZAR
 )
 
 logger = logging.getLogger(__name__)
 
+# Objetos Qt imutáveis compartilhados entre refreshes do Kanban: construídos
+# uma única vez no import, em vez de um QColor/QFont/format() por tarefa a
+# cada _aplicar_tarefas
+_QCOLOR_VIBRANTE = {nivel: QColor(cor) for nivel, cor in enumerate(CORES_PRIORIDADE_VIBRANTE)}
+_QCOLOR_TEXTO_CLARO = QColor("#ffffff")
+
+# Brushes das células da grade de horários: fundo suave por prioridade,
+# texto escuro e o brush vazio que devolve a célula ao visual padrão
+_BRUSH_FUNDO_SUAVE = {nivel: QBrush(QColor(cor)) for nivel, cor in enumerate(CORES_PRIORIDADE_SUAVE)}
+_BRUSH_TEXTO_ESCURO = QBrush(QColor("#1a1a2e"))
+_BRUSH_VAZIO = QBrush()
+
+_FONTE_TAREFA = QFont()
+_FONTE_TAREFA.setBold(True)
+_FONTE_TAREFA_RISCADA = QFont()
+_FONTE_TAREFA_RISCADA.setBold(True)
+_FONTE_TAREFA_RISCADA.setStrikeOut(True)
+
+# Variantes já formatadas em constantes: aqui só o despacho por origem
+_TOOLTIP_TAREFA = {
+    "agenda": TOOLTIP_TAREFA_AGENDA_POR_PRIO,
+    "manual": TOOLTIP_TAREFA_MANUAL_POR_PRIO,
+}
+
+# Nome curto de cada dia ("Segunda" de "Segunda-Feira"), separado uma vez
+# no import em vez de um split por header a cada navegação de semana
+_NOME_DIA_CURTO = {dia: dia.value.split('-')[0] for dia in DiaDaSemana}
+
+# Ordem dos dias e índice de coluna por nome, materializados uma vez:
+# substituem list(DiaDaSemana) e as buscas lineares pelo value do enum
+_DIAS_SEMANA = DIAS_DA_SEMANA
+_INDICE_POR_DIA = {valor: indice for indice, valor in enumerate(DIAS_DA_SEMANA_VALORES)}
+
+# Modelos de combo compartilhados entre todas as instâncias de diálogo:
+# dias, prioridades e periodicidades são fixos, então cada lista é montada
+# uma única vez (na primeira abertura, após o QApplication existir) em vez
+# de N addItem por construção de diálogo
+_MODELOS_COMBO: Dict[str, QStandardItemModel] = {}
+
+
+def _modelo_combo(chave: str, itens: List[Tuple[str, object]]) -> QStandardItemModel:
+    """
+    Retorna o modelo compartilhado da chave, construindo-o na primeira vez.
+
+    Args:
+        chave: Identificador do modelo ('dias', 'prioridades', ...)
+        itens: Pares (texto, dado) para popular o modelo
+
+    Returns:
+        QStandardItemModel pronto para QComboBox.setModel
+    """
+    modelo = _MODELOS_COMBO.get(chave)
+    if modelo is None:
+        modelo = QStandardItemModel()
+        for texto, dado in itens:
+            item = QStandardItem(texto)
+            if dado is not None:
+                item.setData(dado, Qt.ItemDataRole.UserRole)
+            modelo.appendRow(item)
+        _MODELOS_COMBO[chave] = modelo
+    return modelo
+
+
+def _modelo_dias() -> QStandardItemModel:
+    """Modelo compartilhado com os dias da semana."""
+    return _modelo_combo("dias", [(valor, None) for valor in DIAS_DA_SEMANA_VALORES])
+
+
+def _modelo_prioridades() -> QStandardItemModel:
+    """Modelo compartilhado com as descrições de prioridade."""
+    return _modelo_combo(
+        "prioridades",
+        [(descricao, nivel) for nivel, descricao in enumerate(DESCRICOES_PRIORIDADE)]
+    )
+
+
+def _modelo_periodicidades() -> QStandardItemModel:
+    """Modelo compartilhado com as periodicidades."""
+    return _modelo_combo(
+        "periodicidades",
+        [(descricao, codigo) for codigo, descricao in LISTA_PERIODICIDADES]
+    )
+
 
 class BotaoEstilizado(QPushButton):
     """Botão com efeito ripple ao clicar."""
@@ -50,8 +143,19 @@ class BotaoEstilizado(QPushButton):
         super().__init__(texto, pai)
         self._raio_ripple = 0
         self._posicao_clique = QPoint()
-        self._animacao_ripple: Optional[QPropertyAnimation] = None
-        
+        # Animação única reutilizada a cada clique: evita alocar
+        # QPropertyAnimation + conexão de sinal por pressionamento
+        self._animacao_ripple = QPropertyAnimation(self, b"raio_ripple")
+        self._animacao_ripple.setDuration(DURACAO_RIPPLE)
+        self._animacao_ripple.setStartValue(0)
+        self._animacao_ripple.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._animacao_ripple.finished.connect(self._finalizar_ripple)
+
+    def _finalizar_ripple(self) -> None:
+        """Zera o raio ao fim da animação."""
+        self._raio_ripple = 0
+        self.update()
+
     @pyqtProperty(int)
     def raio_ripple(self) -> int:
         return self._raio_ripple
@@ -59,21 +163,26 @@ class BotaoEstilizado(QPushButton):
     @raio_ripple.setter
     def raio_ripple(self, valor: int) -> None:
         self._raio_ripple = valor
-        self.update()
+        # Invalida só a caixa do ripple (com folga para o antialiasing),
+        # em vez do botão inteiro a cada frame da animação
+        raio = valor + 2
+        self.update(QRect(
+            self._posicao_clique.x() - raio,
+            self._posicao_clique.y() - raio,
+            2 * raio,
+            2 * raio
+        ))
     
     def mousePressEvent(self, evento):
         """Inicia animação ripple ao clicar."""
         self._posicao_clique = evento.pos()
-        raio_maximo = max(self.width(), self.height())
-        
-        self._animacao_ripple = QPropertyAnimation(self, b"raio_ripple")
-        self._animacao_ripple.setDuration(DURACAO_RIPPLE)
-        self._animacao_ripple.setStartValue(0)
-        self._animacao_ripple.setEndValue(raio_maximo)
-        self._animacao_ripple.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._animacao_ripple.finished.connect(lambda: setattr(self, '_raio_ripple', 0))
+
+        # Reinicia a animação compartilhada; stop() evita acúmulo de
+        # animações sobrepostas em cliques rápidos
+        self._animacao_ripple.stop()
+        self._animacao_ripple.setEndValue(max(self.width(), self.height()))
         self._animacao_ripple.start()
-        
+
         super().mousePressEvent(evento)
     
     def paintEvent(self, evento):
@@ -82,6 +191,7 @@ class BotaoEstilizado(QPushButton):
         
         if self._raio_ripple > 0:
             pintor = QPainter(self)
+            pintor.setClipRect(evento.rect())
             pintor.setRenderHint(QPainter.RenderHint.Antialiasing)
             pintor.setBrush(QColor(255, 255, 255, 70))
             pintor.setPen(QPen(Qt.PenStyle.NoPen))
@@ -99,23 +209,31 @@ class DialogoBase(QDialog):
         super().__init__(pai)
         self.setWindowTitle(titulo)
         self.setFixedSize(largura, altura)
+        # Uma folha só para o diálogo inteiro; os filhos são estilizados
+        # por objectName em vez de um setStyleSheet cada
+        self.setStyleSheet(ESTILO_DIALOGO_COMBINADO)
         self._aplicar_efeitos_visuais()
     
     def _aplicar_efeitos_visuais(self) -> None:
         """Aplica sombra e animação de fade in ao diálogo."""
-        QTimer.singleShot(
-            ATRASO_FADE_DIALOGO, 
-            lambda: aplicar_sombra(
-                self, 
-                raio_desfoque=DESFOQUE_SOMBRA_DIALOGO,
-                deslocamento_y=DESLOCAMENTO_Y_SOMBRA_DIALOGO,
-                cor=COR_SOMBRA_DIALOGO
-            )
-        )
-        QTimer.singleShot(
-            ATRASO_FADE_DIALOGO + 10, 
-            lambda: fade_in(self, DURACAO_FADE_DIALOGO)
+        # Um único timer para métodos ligados (sem closures capturando self):
+        # diálogos abertos repetidamente deixam de alocar duas lambdas e dois
+        # agendamentos por abertura
+        QTimer.singleShot(ATRASO_FADE_DIALOGO, self._aplicar_sombra_inicial)
+
+    def _aplicar_sombra_inicial(self) -> None:
+        """Aplica a sombra e encadeia o fade in."""
+        aplicar_sombra(
+            self,
+            raio_desfoque=DESFOQUE_SOMBRA_DIALOGO,
+            deslocamento_y=DESLOCAMENTO_Y_SOMBRA_DIALOGO,
+            cor=COR_SOMBRA_DIALOGO
         )
+        QTimer.singleShot(10, self._iniciar_fade)
+
+    def _iniciar_fade(self) -> None:
+        """Inicia a animação de fade in do diálogo."""
+        fade_in(self, DURACAO_FADE_DIALOGO)
 
 
 class DialogoTarefa(DialogoBase):
@@ -135,7 +253,7 @@ class DialogoTarefa(DialogoBase):
         layout.addWidget(self.entrada_titulo)
 
         self.combo_dia = QComboBox()
-        self.combo_dia.addItems([dia.value for dia in DiaDaSemana])
+        self.combo_dia.setModel(_modelo_dias())
         layout.addWidget(QLabel("Dia:"))
         layout.addWidget(self.combo_dia)
 
@@ -166,13 +284,20 @@ class DialogoHorario(DialogoBase):
     
     def _configurar_interface(self) -> None:
         """Configura os elementos da interface seguindo o novo design."""
+        # Debounce da prévia: rajadas de valueChanged (segurar a seta do
+        # spinbox ou rolar o mouse) colapsam em uma atualização por quadro
+        self._timer_previa = QTimer(self)
+        self._timer_previa.setSingleShot(True)
+        self._timer_previa.setInterval(16)
+        self._timer_previa.timeout.connect(self._atualizar_previa)
+
         layout = QVBoxLayout()
         layout.setSpacing(10)
         layout.setContentsMargins(20, 15, 20, 15)
-        
+
         # 1. Título e Separador
         titulo = QLabel("Configurar Horário")
-        titulo.setStyleSheet(ESTILO_DIALOGO_TITULO)
+        titulo.setObjectName("tituloDialogo")
         titulo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(titulo)
         
@@ -188,12 +313,12 @@ class DialogoHorario(DialogoBase):
         
         # 3. Prévia
         lbl_previa_titulo = QLabel("Prévia")
-        lbl_previa_titulo.setStyleSheet("font-weight: bold; font-size: 12px; color: #a29bfe;")
+        lbl_previa_titulo.setObjectName("previaTituloDialogo")
         lbl_previa_titulo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(lbl_previa_titulo)
         
         self.label_previa = QLabel("00:00 horas")
-        self.label_previa.setStyleSheet(ESTILO_DIALOGO_BOX_PREVIA)
+        self.label_previa.setObjectName("boxPreviaDialogo")
         self.label_previa.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.label_previa)
         
@@ -222,12 +347,12 @@ class DialogoHorario(DialogoBase):
         
         # Hora
         lbl_hora = QLabel("Hora:")
-        lbl_hora.setStyleSheet(ESTILO_DIALOGO_LABEL_INPUT)
+        lbl_hora.setObjectName("labelInputDialogo")
         self.spin_hora = self._criar_spinbox(0, 23, "h", HORARIO_INICIAL_SPINBOX)
         
         # Minuto
         lbl_min = QLabel("Minuto:")
-        lbl_min.setStyleSheet(ESTILO_DIALOGO_LABEL_INPUT)
+        lbl_min.setObjectName("labelInputDialogo")
         self.spin_minuto = self._criar_spinbox(0, 59, "min", MINUTO_INICIAL_SPINBOX)
         
         # Montagem com Stretch para centralizar o bloco
@@ -249,17 +374,19 @@ class DialogoHorario(DialogoBase):
         spin.setSuffix(f" {sufixo}")
         spin.setMinimumWidth(LARGURA_MINIMA_SPINBOX)
         spin.setMinimumHeight(ALTURA_MINIMA_SPINBOX)
-        spin.setStyleSheet(ESTILO_SPINBOX)
         spin.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        spin.valueChanged.connect(self._atualizar_previa)
+        spin.valueChanged.connect(self._agendar_previa)
         return spin
-    
+
+    def _agendar_previa(self, _valor: int = 0) -> None:
+        """(Re)arma o timer de debounce da prévia."""
+        self._timer_previa.start()
+
     def _atualizar_previa(self) -> None:
         """Atualiza a prévia do horário formatado."""
-        if hasattr(self, 'spin_hora') and hasattr(self, 'spin_minuto') and hasattr(self, 'label_previa'):
-            hora = self.spin_hora.value()
-            minuto = self.spin_minuto.value()
-            self.label_previa.setText(f"{hora:02d}:{minuto:02d} horas")
+        hora = self.spin_hora.value()
+        minuto = self.spin_minuto.value()
+        self.label_previa.setText(f"{hora:02d}:{minuto:02d} horas")
 
     def obter_horario(self) -> str:
         """Retorna o horário formatado (HH:MM)."""
@@ -289,7 +416,7 @@ class DialogoAtividade(DialogoBase):
         
         # Título
         titulo = QLabel("Nova Atividade")
-        titulo.setStyleSheet(ESTILO_DIALOGO_TITULO)
+        titulo.setObjectName("tituloDialogo")
         titulo.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(titulo)
         
@@ -307,7 +434,7 @@ class DialogoAtividade(DialogoBase):
         # Dia da semana
         layout.addWidget(QLabel("Dia da Semana:"))
         self.combo_dia = QComboBox()
-        self.combo_dia.addItems([dia.value for dia in DiaDaSemana])
+        self.combo_dia.setModel(_modelo_dias())
         if self.dia_preenchido:
             indice = self.combo_dia.findText(self.dia_preenchido)
             if indice >= 0:
@@ -321,16 +448,14 @@ class DialogoAtividade(DialogoBase):
         # Prioridade
         layout.addWidget(QLabel("Prioridade:"))
         self.combo_prioridade = QComboBox()
-        for nivel, descricao in DESCRICOES_PRIORIDADE.items():
-            self.combo_prioridade.addItem(descricao, nivel)
+        self.combo_prioridade.setModel(_modelo_prioridades())
         self.combo_prioridade.setCurrentIndex(3)  # P3 como padrão
         layout.addWidget(self.combo_prioridade)
-        
+
         # Periodicidade
         layout.addWidget(QLabel("Periodicidade:"))
         self.combo_periodicidade = QComboBox()
-        for codigo, descricao in LISTA_PERIODICIDADES:
-            self.combo_periodicidade.addItem(descricao, codigo)
+        self.combo_periodicidade.setModel(_modelo_periodicidades())
         self.combo_periodicidade.setCurrentIndex(2)  # Semanal como padrão
         layout.addWidget(self.combo_periodicidade)
         
@@ -405,10 +530,14 @@ class DialogoAtividade(DialogoBase):
 
 class ListaArrastavel(QListWidget):
     """Lista com suporte a arrastar e soltar tarefas."""
-    
+
     tarefa_movida = pyqtSignal(int, str, str)
     tarefa_deletada = pyqtSignal(int)
 
+    # MIME próprio com o id empacotado em binário: dispensa montar/parsear
+    # a string "id|titulo" a cada evento de arrasto
+    MIME_TAREFA_ID = "application/x-tarefa-id"
+
     def __init__(self, dia: str, status: str, pai: Optional[QWidget] = None):
         super().__init__(pai)
         self.dia = dia
@@ -425,14 +554,14 @@ class ListaArrastavel(QListWidget):
 
     def dragEnterEvent(self, evento):
         """Aceita evento de entrada de arrasto."""
-        if evento.mimeData().hasText():
+        if evento.mimeData().hasFormat(self.MIME_TAREFA_ID):
             evento.accept()
         else:
             evento.ignore()
 
     def dragMoveEvent(self, evento):
         """Aceita movimento de arrasto."""
-        if evento.mimeData().hasText():
+        if evento.mimeData().hasFormat(self.MIME_TAREFA_ID):
             evento.setDropAction(Qt.DropAction.MoveAction)
             evento.accept()
         else:
@@ -440,17 +569,23 @@ class ListaArrastavel(QListWidget):
 
     def dropEvent(self, evento):
         """Processa evento de soltar item."""
-        if not evento.mimeData().hasText():
+        if not evento.mimeData().hasFormat(self.MIME_TAREFA_ID):
             evento.ignore()
             return
-            
+
+        # Soltar na própria lista é um no-op: a tarefa já está neste
+        # dia/status, então nem o serviço precisa ser consultado
+        if evento.source() is self:
+            evento.ignore()
+            return
+
         try:
-            dados = evento.mimeData().text().split('|')
-            id_tarefa = int(dados[0])
+            payload = bytes(evento.mimeData().data(self.MIME_TAREFA_ID))
+            id_tarefa = struct.unpack("<q", payload)[0]
             self.tarefa_movida.emit(id_tarefa, self.dia, self.status)
             evento.setDropAction(Qt.DropAction.MoveAction)
             evento.accept()
-        except (ValueError, IndexError):
+        except struct.error:
             evento.ignore()
 
     def startDrag(self, acoes_suportadas):
@@ -458,10 +593,10 @@ class ListaArrastavel(QListWidget):
         item = self.currentItem()
         if not item:
             return
-            
+
         mime = QMimeData()
         id_tarefa = item.data(Qt.ItemDataRole.UserRole)
-        mime.setText(f"{id_tarefa}|{item.text()}")
+        mime.setData(self.MIME_TAREFA_ID, QByteArray(struct.pack("<q", id_tarefa)))
         arrasto = QDrag(self)
         arrasto.setMimeData(mime)
         arrasto.exec(acoes_suportadas)
@@ -486,12 +621,25 @@ class ColunaDia(QWidget):
     
     # Sinal emitido quando dados são alterados e a interface precisa ser atualizada
     dados_alterados = pyqtSignal()
-    
+
+    # Entrega interna do render pronto: (dados_render, geração)
+    _render_pronto = pyqtSignal(list, int)
+
     def __init__(self, dia: DiaDaSemana, servico_tarefas: ServicoTarefas, pai: Optional[QWidget] = None):
         super().__init__(pai)
         self.dia = dia
         self.servico_tarefas = servico_tarefas
         self.listas: Dict[str, ListaArrastavel] = {}
+        # Controle de refresh: coalescer chamadas na mesma iteração do event
+        # loop e pular recargas quando a versão dos dados não mudou
+        self._atualizacao_pendente = False
+        self._versao_aplicada = -1
+        # Geração do render: resultados obsoletos (de um refresh antigo que
+        # terminou depois) são descartados em vez de repintar dado velho
+        self._geracao_render = 0
+        self._render_pronto.connect(
+            self._ao_render_pronto, Qt.ConnectionType.QueuedConnection
+        )
         self._configurar_interface()
 
     def _configurar_interface(self) -> None:
@@ -516,7 +664,7 @@ class ColunaDia(QWidget):
     def _adicionar_secao_status(self, layout: QVBoxLayout, status: StatusTarefa) -> None:
         """Adiciona uma seção de status à coluna."""
         rotulo = QLabel(status.value)
-        rotulo.setStyleSheet(ESTILO_ROTULO_STATUS)
+        rotulo.setObjectName("rotuloStatusColuna")
         layout.addWidget(rotulo)
         
         lista = ListaArrastavel(self.dia.value, status.value, self)
@@ -531,8 +679,10 @@ class ColunaDia(QWidget):
         status_enum = converter_string_para_status(novo_status)
         
         if dia_enum and status_enum:
-            self.servico_tarefas.mover_tarefa(id_tarefa, dia_enum, status_enum)
-            self.dados_alterados.emit()
+            # Só notifica as demais colunas quando a tarefa de fato mudou
+            # de dia/status; drops no mesmo lugar não disparam refresh
+            if self.servico_tarefas.mover_tarefa(id_tarefa, dia_enum, status_enum):
+                self.dados_alterados.emit()
 
     def _tratar_delecao_tarefa(self, id_tarefa: int) -> None:
         """Trata deleção de tarefa."""
@@ -548,62 +698,129 @@ class ColunaDia(QWidget):
 
     def atualizar(self) -> None:
         """Atualiza a visualização da coluna de forma assíncrona."""
-        self.servico_tarefas.obter_tarefas_do_dia_async(
-            self.dia,
-            callback_sucesso=self._aplicar_tarefas,
-            callback_erro=self._tratar_erro_carregamento
+        # Várias emissões de dados_alterados na mesma iteração do event
+        # loop (ex.: drop + deleção em sequência) viram um único refresh
+        if self._atualizacao_pendente:
+            return
+        self._atualizacao_pendente = True
+        QTimer.singleShot(0, self._executar_atualizacao)
+
+    def _executar_atualizacao(self) -> None:
+        """Dispara a recarga assíncrona se os dados mudaram desde a última."""
+        self._atualizacao_pendente = False
+        versao = self.servico_tarefas.versao_dados()
+        if versao == self._versao_aplicada:
+            return
+        self._versao_aplicada = versao
+        self._geracao_render += 1
+        # Pré-render (parse de título, tooltip, strikethrough) é trabalho
+        # de CPU: no pool próprio, uma sincronização longa no pool de I/O
+        # não segura o refresh das colunas
+        executar_async(
+            self._carregar_dados_render,
+            self._emitir_render,
+            self._tratar_erro_carregamento,
+            self._geracao_render,
+            tipo="cpu"
         )
-    
-    def _aplicar_tarefas(self, tarefas: list) -> None:
-        """Aplica as tarefas carregadas à interface com badges de prioridade."""
-        for lista in self.listas.values():
-            lista.clear()
-        
+
+    def _emitir_render(self, resultado: tuple) -> None:
+        """Encaminha o render pronto pela conexão enfileirada."""
+        geracao, dados_render = resultado
+        self._render_pronto.emit(dados_render, geracao)
+
+    def _ao_render_pronto(self, dados_render: list, geracao: int) -> None:
+        """Aplica o render se ele ainda corresponde ao refresh mais recente."""
+        if geracao != self._geracao_render:
+            return
+        self._aplicar_tarefas(dados_render)
+
+    def _carregar_dados_render(self, geracao: int) -> Tuple[int, list]:
+        """
+        Roda no worker: busca as tarefas do dia e pré-computa tudo que não
+        precisa da thread de GUI (título limpo, strikethrough, tooltip).
+
+        Args:
+            geracao: Geração do refresh que disparou esta carga
+
+        Returns:
+            Tupla (geracao, lista de (status, titulo, id, prioridade, feito, tooltip))
+        """
+        tarefas = self.servico_tarefas.obter_tarefas_do_dia(self.dia)
+        dados_render = []
         for tarefa in tarefas:
-            if tarefa.status in self.listas:
-                prioridade = tarefa.prioridade if hasattr(tarefa, 'prioridade') and tarefa.prioridade is not None else 3
-                
-                # Usar ExtratorMetadados para limpar o título
-                titulo_limpo = ExtratorMetadados.extrair_titulo_limpo(tarefa.titulo)
-                
-                # Se tarefa está em "Feito", aplicar strikethrough no texto
-                if tarefa.status == StatusTarefa.FEITO.value:
-                    titulo_exibicao = self._aplicar_strikethrough(titulo_limpo)
-                else:
-                    titulo_exibicao = titulo_limpo
-                
-                item = QListWidgetItem(titulo_exibicao)
-                item.setData(Qt.ItemDataRole.UserRole, tarefa.id)
-                
-                # Configurar fonte
-                fonte = QFont()
-                fonte.setBold(True)
-                if tarefa.status == StatusTarefa.FEITO.value:
-                    fonte.setStrikeOut(True)
-                item.setFont(fonte)
-                
-                # Aplicar cor de fundo baseada na prioridade
-                cor_fundo = CORES_PRIORIDADE_VIBRANTE.get(prioridade)
+            prioridade = tarefa.prioridade if tarefa.prioridade is not None else 3
+            titulo = ExtratorMetadados.extrair_titulo_limpo(tarefa.titulo)
+            feito = tarefa.status == StatusTarefa.FEITO.value
+            origem = "agenda" if tarefa.origem == "agenda" else "manual"
+            dados_render.append(
+                (tarefa.status, titulo, tarefa.id, prioridade, feito,
+                 _TOOLTIP_TAREFA[origem][prioridade])
+            )
+        return geracao, dados_render
+
+    def _aplicar_tarefas(self, dados_render: list) -> None:
+        """Aplica à interface os dados de render pré-computados no worker."""
+        # Agrupar por status antes de tocar nos widgets; cada lista é
+        # repovoada de uma vez, com updates e sinais suspensos, para que a
+        # coluna dispare um único repaint em vez de um por item
+        dados_por_status: Dict[str, list] = {status: [] for status in self.listas}
+        for dados in dados_render:
+            if dados[0] in dados_por_status:
+                dados_por_status[dados[0]].append(dados)
+
+        self.setUpdatesEnabled(False)
+        try:
+            for status, lista in self.listas.items():
+                self._repovoar_lista(lista, dados_por_status[status])
+        finally:
+            self.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _repovoar_lista(lista: ListaArrastavel, dados: list) -> None:
+        """
+        Repovoa uma lista reaproveitando os QListWidgetItems existentes.
+
+        Em vez de clear() + itens novos a cada refresh, os itens já
+        alocados são reconfigurados in-place; só a diferença de tamanho
+        aloca ou descarta itens — alocação próxima de zero em regime
+        estável de arrastar e soltar.
+        """
+        lista.blockSignals(True)
+        lista.setUpdatesEnabled(False)
+        try:
+            while lista.count() > len(dados):
+                lista.takeItem(lista.count() - 1)
+            while lista.count() < len(dados):
+                lista.addItem(QListWidgetItem())
+
+            for indice, (_, titulo, id_tarefa, prioridade, feito, tooltip) in enumerate(dados):
+                item = lista.item(indice)
+                item.setText(titulo)
+                item.setData(Qt.ItemDataRole.UserRole, id_tarefa)
+                item.setFont(_FONTE_TAREFA_RISCADA if feito else _FONTE_TAREFA)
+
+                cor_fundo = _QCOLOR_VIBRANTE.get(prioridade)
                 if cor_fundo:
-                    item.setBackground(QColor(cor_fundo))
-                    item.setForeground(QColor("#ffffff"))
-                
-                # Indicar origem da tarefa (agenda vs manual)
-                if hasattr(tarefa, 'origem') and tarefa.origem == "agenda":
-                    item.setToolTip(TOOLTIP_TAREFA_AGENDA.format(prioridade=prioridade))
+                    item.setBackground(cor_fundo)
+                    item.setForeground(_QCOLOR_TEXTO_CLARO)
                 else:
-                    item.setToolTip(TOOLTIP_TAREFA_MANUAL.format(prioridade=prioridade))
-                
-                self.listas[tarefa.status].addItem(item)
-    
-    @staticmethod
-    def _aplicar_strikethrough(texto: str) -> str:
-        """Aplica caractere de strikethrough Unicode a cada caractere do texto."""
-        return ''.join(c + '\u0336' for c in texto)
+                    # Item reaproveitado pode carregar cores do uso anterior
+                    item.setBackground(QBrush())
+                    item.setForeground(QBrush())
+
+                item.setToolTip(tooltip)
+        finally:
+            lista.setUpdatesEnabled(True)
+            lista.blockSignals(False)
     
     def _tratar_erro_carregamento(self, erro: Exception) -> None:
         """Trata erros no carregamento de tarefas."""
         logger.error(f"Erro ao carregar tarefas para {self.dia.value}: {erro}")
+        # A versão foi marcada como aplicada antes da carga concluir; sem o
+        # reset, o próximo atualizar() curto-circuitaria e a coluna ficaria
+        # com dados velhos até outra mutação subir a versão
+        self._versao_aplicada = -1
 
 
 class VisualizacaoHorarios(QWidget):
@@ -619,6 +836,22 @@ class VisualizacaoHorarios(QWidget):
         self.servico_horarios = servico_horarios
         self.servico_sincronizacao = servico_sincronizacao
         self.semana_offset = 0  # 0 = semana atual, -1 = semana passada, +1 = próxima
+        # Offset refletido na interface; clicar 'Hoje' já estando na
+        # semana atual não dispara label, headers nem recarga do banco
+        self._offset_aplicado = 0
+        # Cache das datas da semana, chaveado por (offset, ordinal de hoje):
+        # headers, label e preenchimento da grade reusam o mesmo resultado
+        self._chave_datas_semana: Optional[Tuple[int, int]] = None
+        self._datas_semana: Tuple[date, ...] = ()
+        self._chave_headers: Optional[Tuple[Tuple[int, ...], int]] = None
+        # Debounce da recarga: navegação rápida entre semanas (cliques ou
+        # setas seguradas) reinicia o timer e só a última parada dispara a
+        # ida ao banco; o token de geração descarta respostas atrasadas
+        self._geracao_carga = 0
+        self._timer_reload = QTimer(self)
+        self._timer_reload.setSingleShot(True)
+        self._timer_reload.setInterval(80)
+        self._timer_reload.timeout.connect(self._carregar_dados_real)
         self._configurar_interface()
 
     def _configurar_interface(self) -> None:
@@ -645,7 +878,7 @@ class VisualizacaoHorarios(QWidget):
         # Botao incluir atividade
         botao_incluir = BotaoEstilizado("Incluir Atividade")
         botao_incluir.setCursor(Qt.CursorShape.PointingHandCursor)
-        botao_incluir.setStyleSheet(ESTILO_BOTAO_ADICIONAR_HORARIO)
+        botao_incluir.setObjectName("botaoDestaqueAgenda")
         botao_incluir.clicked.connect(self._incluir_atividade)
         toolbar.addWidget(botao_incluir)
         
@@ -658,7 +891,7 @@ class VisualizacaoHorarios(QWidget):
         # Botao sincronizar com Kanban
         botao_sincronizar = BotaoEstilizado("Sincronizar Kanban")
         botao_sincronizar.setCursor(Qt.CursorShape.PointingHandCursor)
-        botao_sincronizar.setStyleSheet(ESTILO_BOTAO_ADICIONAR_HORARIO)
+        botao_sincronizar.setObjectName("botaoDestaqueAgenda")
         botao_sincronizar.setToolTip("Sincroniza as atividades do dia atual para o quadro Kanban")
         botao_sincronizar.clicked.connect(self._solicitar_sincronizacao)
         toolbar.addWidget(botao_sincronizar)
@@ -687,7 +920,7 @@ class VisualizacaoHorarios(QWidget):
         # Label da semana atual
         self.label_semana = QLabel()
         self.label_semana.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.label_semana.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.label_semana.setObjectName("labelSemanaAgenda")
         nav.addWidget(self.label_semana)
         
         nav.addStretch()
@@ -706,16 +939,16 @@ class VisualizacaoHorarios(QWidget):
         
         return nav
     
-    def _obter_datas_semana(self) -> List[date]:
+    def _obter_datas_semana(self) -> Tuple[date, ...]:
         """Retorna as datas de segunda a sexta da semana atual (com offset)."""
         hoje = date.today()
-        # Encontrar a segunda-feira da semana
-        dias_desde_segunda = hoje.weekday()
-        segunda = hoje - timedelta(days=dias_desde_segunda)
-        # Aplicar offset de semanas
-        segunda = segunda + timedelta(weeks=self.semana_offset)
-        # Retornar segunda a sexta
-        return [segunda + timedelta(days=i) for i in range(5)]
+        chave = (self.semana_offset, hoje.toordinal())
+        if chave != self._chave_datas_semana:
+            # Encontrar a segunda-feira da semana e aplicar o offset
+            segunda = hoje - timedelta(days=hoje.weekday()) + timedelta(weeks=self.semana_offset)
+            self._datas_semana = tuple(segunda + timedelta(days=i) for i in range(5))
+            self._chave_datas_semana = chave
+        return self._datas_semana
     
     def _atualizar_label_semana(self) -> None:
         """Atualiza o label com informacoes da semana."""
@@ -757,20 +990,39 @@ class VisualizacaoHorarios(QWidget):
         
         datas = self._obter_datas_semana()
         hoje = date.today()
-        
+
+        # Navegar de volta para a mesma semana não refaz nada — a chave por
+        # ordinais sai antes mesmo de montar as strings dos headers
+        chave = (tuple(data.toordinal() for data in datas), hoje.toordinal())
+        if chave == self._chave_headers and tabela is getattr(self, 'tabela', None):
+            return
+
         headers = []
         for i, dia in enumerate(DiaDaSemana):
             data = datas[i]
-            nome_dia = dia.value.split('-')[0]  # "Segunda" de "Segunda-Feira"
+            nome_dia = _NOME_DIA_CURTO[dia]
             data_str = data.strftime("%d/%m")
-            
+
             # Marcar o dia atual
             if data == hoje:
                 headers.append(f">> {nome_dia} <<\n{data_str}")
             else:
                 headers.append(f"{nome_dia}\n{data_str}")
-        
-        tabela.setHorizontalHeaderLabels(headers)
+
+        tabela.setUpdatesEnabled(False)
+        tabela.blockSignals(True)
+        try:
+            if tabela.horizontalHeaderItem(0) is not None:
+                # Headers já existem: troca só o texto, sem recriar itens
+                for indice, texto in enumerate(headers):
+                    tabela.horizontalHeaderItem(indice).setText(texto)
+            else:
+                tabela.setHorizontalHeaderLabels(headers)
+        finally:
+            tabela.blockSignals(False)
+            tabela.setUpdatesEnabled(True)
+
+        self._chave_headers = chave
     
     def _semana_anterior(self) -> None:
         """Navega para a semana anterior."""
@@ -789,6 +1041,10 @@ class VisualizacaoHorarios(QWidget):
     
     def _atualizar_navegacao(self) -> None:
         """Atualiza a interface apos mudanca de semana."""
+        if self.semana_offset == self._offset_aplicado:
+            return
+
+        self._offset_aplicado = self.semana_offset
         self._atualizar_label_semana()
         self._atualizar_headers_tabela()
         self.carregar_dados()
@@ -799,13 +1055,8 @@ class VisualizacaoHorarios(QWidget):
         if dialogo.exec():
             dados = dialogo.obter_dados()
             if dados:
-                # Encontrar índice do dia
-                indice_dia = None
-                for i, dia in enumerate(DiaDaSemana):
-                    if dia.value == dados['dia_semana']:
-                        indice_dia = i
-                        break
-                
+                indice_dia = _INDICE_POR_DIA.get(dados['dia_semana'])
+
                 if indice_dia is not None:
                     horario = dados['horario']
                     
@@ -838,25 +1089,28 @@ class VisualizacaoHorarios(QWidget):
             return
         
         horario = self._horarios_atuais[linha]
-        dia = list(DiaDaSemana)[coluna].value
-        
+        dia = _DIAS_SEMANA[coluna].value
+
+        # Uma travessia Python->Qt só; o texto decide duas ações abaixo
+        tem_atividade = bool(item.text())
+
         menu = QMenu(self)
-        
+
         # Editar atividade existente
-        if item.text():
+        if tem_atividade:
             acao_editar = QAction(f"Editar atividade", self)
             acao_editar.triggered.connect(lambda: self._editar_atividade_celula(horario, dia, coluna, linha))
             menu.addAction(acao_editar)
-            
+
             menu.addSeparator()
-        
+
         # Adicionar atividade nesta celula
         acao_adicionar = QAction(f"Incluir atividade em {horario}", self)
         acao_adicionar.triggered.connect(lambda: self._incluir_atividade_celula(horario, dia, coluna))
         menu.addAction(acao_adicionar)
-        
+
         # Limpar celula
-        if item.text():
+        if tem_atividade:
             acao_limpar = QAction("Limpar célula", self)
             acao_limpar.triggered.connect(lambda: self._limpar_celula(linha, coluna))
             menu.addAction(acao_limpar)
@@ -881,11 +1135,12 @@ class VisualizacaoHorarios(QWidget):
     def _editar_atividade_celula(self, horario: str, dia: str, coluna: int, linha: int) -> None:
         """Abre diálogo para editar atividade existente."""
         item = self.tabela.item(linha, coluna)
-        if not item or not item.text():
+        texto_exibido = item.text() if item else ""
+        if not texto_exibido:
             return
-        
+
         # Obter texto completo armazenado (com metadados)
-        texto_completo = item.data(Qt.ItemDataRole.UserRole) or item.text()
+        texto_completo = item.data(Qt.ItemDataRole.UserRole) or texto_exibido
         
         # Extrair todos os metadados de uma vez
         metadados = ExtratorMetadados.extrair_metadados(texto_completo)
@@ -914,24 +1169,15 @@ class VisualizacaoHorarios(QWidget):
                     data_criacao=data_criacao_original
                 )
                 
-                # Salvar na mesma célula ou na nova posição se dia/horário mudaram
+                # Salvar na mesma célula ou na nova posição se dia/horário
+                # mudaram — limpeza da origem, criação do horário e
+                # gravação do destino numa transação só no serviço
                 novo_horario = dados['horario']
-                novo_indice_dia = None
-                for i, d in enumerate(DiaDaSemana):
-                    if d.value == dados['dia_semana']:
-                        novo_indice_dia = i
-                        break
-                
-                # Se mudou de posição, limpar a antiga
-                if novo_horario != horario or novo_indice_dia != coluna:
-                    self.servico_horarios.salvar_atividade(horario, coluna, "")
-                    
-                    # Verificar se novo horário existe
-                    horarios_existentes = self.servico_horarios.obter_horarios_ordenados()
-                    if novo_horario not in horarios_existentes:
-                        self.servico_horarios.adicionar_horario(novo_horario)
-                
-                self.servico_horarios.salvar_atividade(novo_horario, novo_indice_dia, texto_atividade)
+                novo_indice_dia = _INDICE_POR_DIA.get(dados['dia_semana'])
+
+                self.servico_horarios.mover_atividade(
+                    horario, coluna, novo_horario, novo_indice_dia, texto_atividade
+                )
                 self.carregar_dados()
     
     def _limpar_celula(self, linha: int, coluna: int) -> None:
@@ -951,103 +1197,109 @@ class VisualizacaoHorarios(QWidget):
         self.sincronizacao_solicitada.emit()
 
     def carregar_dados(self) -> None:
+        """Agenda a recarga da tabela, coalescendo pedidos em rajada."""
+        self._timer_reload.start()
+
+    def _carregar_dados_real(self) -> None:
         """Carrega todos os dados da tabela de forma assincrona."""
-        self.tabela.blockSignals(True)
-        self.tabela.clearContents()
-        
-        # Carregar horarios de forma assincrona
-        self.servico_horarios.obter_horarios_ordenados_async(
-            callback_sucesso=self._ao_carregar_horarios,
+        # Sem clearContents(): os QTableWidgetItems existentes são
+        # reconfigurados in-place no repovoamento, sem flash de tabela
+        # vazia. Os sinais são bloqueados só nos trechos síncronos que
+        # mutam a tabela — bloquear aqui e desbloquear no callback deixava
+        # a tabela surda entre as idas ao banco (e para sempre, se um
+        # callback se perdesse)
+        self._geracao_carga += 1
+        geracao = self._geracao_carga
+
+        # Uma viagem só de worker: horários e grade expandida (diárias
+        # replicadas na semana) chegam juntos num único callback
+        self.servico_horarios.obter_grade_completa_async(
+            self._obter_datas_semana(),
+            callback_sucesso=lambda resultado: self._ao_carregar_grade(resultado, geracao),
             callback_erro=self._tratar_erro_carregamento
         )
-    
-    def _ao_carregar_horarios(self, horarios_ordenados: list) -> None:
-        """Callback apos carregar horarios."""
+
+    def _ao_carregar_grade(self, resultado: tuple, geracao: int) -> None:
+        """Callback único com horários ordenados e grade expandida."""
+        if geracao != self._geracao_carga:
+            return  # Resposta de uma recarga superada; a mais nova assume
+
+        horarios_ordenados, dados = resultado
         self._configurar_linhas_tabela(horarios_ordenados)
-        
-        # Carregar dados da grade de forma assincrona
-        self.servico_horarios.obter_dados_grade_async(
-            callback_sucesso=lambda dados: self._ao_carregar_dados_grade(horarios_ordenados, dados),
-            callback_erro=self._tratar_erro_carregamento
-        )
-    
-    def _ao_carregar_dados_grade(self, horarios: list, dados: dict) -> None:
-        """Callback apos carregar dados da grade."""
-        self._preencher_tabela_com_dados(horarios, dados)
-        self.tabela.blockSignals(False)
+        self._preencher_tabela_com_dados(horarios_ordenados, dados)
     
     def _configurar_linhas_tabela(self, horarios: list) -> None:
         """Configura o numero de linhas e rotulos."""
-        self.tabela.setRowCount(len(horarios))
-        self.tabela.setVerticalHeaderLabels(horarios)
+        self.tabela.blockSignals(True)
+        try:
+            self.tabela.setRowCount(len(horarios))
+            self.tabela.setVerticalHeaderLabels(horarios)
+        finally:
+            self.tabela.blockSignals(False)
         self._horarios_atuais = horarios
     
     def _preencher_tabela_com_dados(self, horarios: list, dados: dict) -> None:
-        """Preenche a tabela com dados fornecidos, aplicando cores de prioridade."""
-        import re
-        from datetime import date
-        
-        # Primeiro, identificar atividades diárias para replicar em todas as colunas
-        atividades_diarias = {}  # {(horario, coluna): texto_completo}
-        for (horario, coluna), texto in dados.items():
-            if texto:
-                metadados = ExtratorMetadados.extrair_metadados(texto)
-                if metadados.periodicidade == "diaria":
-                    data_criacao = metadados.data_criacao or date.today()
-                    
-                    # Verificar se as datas da semana atual são >= data de criação
-                    datas_semana = self._obter_datas_semana()
-                    for idx, data_dia in enumerate(datas_semana):
-                        if data_dia >= data_criacao:
-                            chave = (horario, idx)
-                            if chave not in atividades_diarias:
-                                atividades_diarias[chave] = texto
-        
-        # Mesclar atividades diárias com os dados originais
-        dados_completos = dict(dados)
-        for chave, texto in atividades_diarias.items():
-            if chave not in dados_completos or not dados_completos[chave]:
-                dados_completos[chave] = texto
-        
+        """Preenche a tabela com dados fornecidos, aplicando cores de prioridade.
+
+        As atividades diárias já chegam replicadas pelo serviço
+        (obter_grade_expandida); aqui só resta pintar as células.
+        """
+        self.tabela.blockSignals(True)
+        try:
+            self._preencher_celulas(horarios, dados)
+        finally:
+            self.tabela.blockSignals(False)
+
+    def _preencher_celulas(self, horarios: list, dados: dict) -> None:
+        """Reconfigura cada célula da tabela in-place."""
         for indice_linha, horario in enumerate(horarios):
             for indice_coluna in range(5):
-                texto_completo = dados_completos.get((horario, indice_coluna), "")
-                
+                texto_completo = dados.get((horario, indice_coluna), "")
+
+                # Reusar o item existente da célula: recriar 5 itens por
+                # linha a cada recarga custa alocação e realocação de
+                # geometria; reconfigurar in-place não custa nada no Qt
+                item = self.tabela.item(indice_linha, indice_coluna)
+                if item is None:
+                    item = QTableWidgetItem()
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                    self.tabela.setItem(indice_linha, indice_coluna, item)
+
                 if texto_completo:
                     # Extrair metadados usando a classe centralizada
                     metadados = ExtratorMetadados.extrair_metadados(texto_completo)
-                    item = QTableWidgetItem(metadados.titulo)
-                    
+                    item.setText(metadados.titulo)
+
                     # Criar tooltip com informações detalhadas
-                    nome_prioridade = NOMES_PRIORIDADE.get(metadados.prioridade, "N/A")
+                    # Prioridade sai do parser sempre em 0-3: índice direto
+                    nome_prioridade = NOMES_PRIORIDADE[metadados.prioridade]
                     nome_periodicidade = NOMES_PERIODICIDADE.get(metadados.periodicidade, metadados.periodicidade)
-                    data_str = metadados.data_criacao.isoformat() if metadados.data_criacao else ""
-                    
-                    tooltip = TOOLTIP_ATIVIDADE.format(
-                        prioridade=metadados.prioridade,
-                        nome_prioridade=nome_prioridade,
-                        periodicidade=nome_periodicidade,
-                        data=data_str
+                    tooltip = montar_tooltip_atividade(
+                        metadados.prioridade, nome_prioridade, nome_periodicidade,
+                        metadados.data_criacao_iso
                     )
                     item.setToolTip(tooltip)
-                    
+
                     # Aplicar cor de fundo baseada na prioridade
-                    cor_fundo = CORES_PRIORIDADE_SUAVE.get(metadados.prioridade)
-                    if cor_fundo:
-                        item.setBackground(QColor(cor_fundo))
-                        item.setForeground(QColor("#1a1a2e"))
+                    brush_fundo = _BRUSH_FUNDO_SUAVE.get(metadados.prioridade)
+                    if brush_fundo is not None:
+                        item.setBackground(brush_fundo)
+                        item.setForeground(_BRUSH_TEXTO_ESCURO)
+                    else:
+                        item.setBackground(_BRUSH_VAZIO)
+                        item.setForeground(_BRUSH_VAZIO)
                 else:
-                    item = QTableWidgetItem("")
-                
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                    item.setText("")
+                    item.setToolTip("")
+                    item.setBackground(_BRUSH_VAZIO)
+                    item.setForeground(_BRUSH_VAZIO)
+
                 # Guardar texto completo como dado do item para salvar corretamente
                 item.setData(Qt.ItemDataRole.UserRole, texto_completo)
-                self.tabela.setItem(indice_linha, indice_coluna, item)
     
     def _tratar_erro_carregamento(self, erro: Exception) -> None:
         """Trata erros no carregamento de dados."""
         logger.error(f"Erro ao carregar dados de horários: {erro}")
-        self.tabela.blockSignals(False)
 
     def _ao_salvar_celula(self, linha: int, coluna: int) -> None:
         """Salva alterações em uma célula."""
@@ -1117,16 +1369,12 @@ class VisualizacaoHorarios(QWidget):
         if dialogo.exec():
             horario_novo = dialogo.obter_horario()
             if horario_novo and horario_novo != horario_antigo:
-                # Remover horário antigo e adicionar novo
-                if self.servico_horarios.remover_horario(horario_antigo):
-                    if self.servico_horarios.adicionar_horario(horario_novo):
-                        self.carregar_dados()
-                    else:
-                        # Se falhar ao adicionar, restaurar o antigo
-                        self.servico_horarios.adicionar_horario(horario_antigo)
-                        QMessageBox.warning(self, "Aviso", MSG_ERRO_ATUALIZAR_HORARIO)
+                # Remoção e inclusão numa transação só: o rollback do
+                # serviço dispensa o restaura-o-antigo manual daqui
+                if self.servico_horarios.substituir_horario(horario_antigo, horario_novo):
+                    self.carregar_dados()
                 else:
-                    QMessageBox.critical(self, "Erro", MSG_ERRO_EDITAR_HORARIO)
+                    QMessageBox.warning(self, "Aviso", MSG_ERRO_ATUALIZAR_HORARIO)
     
     def _excluir_linha(self, horario: str) -> None:
         """Exclui uma linha de horário após confirmação."""
@@ -1152,6 +1400,18 @@ class DialogoCalendarioMensal(QDialog):
         self.servico_horarios = servico_horarios
         self.setWindowTitle("Calendário Mensal")
         self.setMinimumSize(700, 550)
+        # Formatos prontos por prioridade: setDateTextFormat copia o
+        # formato, então as mesmas 4 instâncias servem para todas as datas
+        self._formatos_por_prioridade = {}
+        for nivel in _QCOLOR_VIBRANTE:
+            formato = QTextCharFormat()
+            formato.setBackground(QBrush(_QCOLOR_VIBRANTE[nivel]))
+            formato.setForeground(QBrush(_QCOLOR_TEXTO_CLARO))
+            formato.setFontWeight(QFont.Weight.Bold)
+            self._formatos_por_prioridade[nivel] = formato
+        # Estado aplicado no widget: {date: prioridade} da última marcação,
+        # base do diff que evita repintar datas inalteradas
+        self._datas_marcadas = {}
         self._configurar_interface()
         self._carregar_atividades()
     
@@ -1171,7 +1431,7 @@ class DialogoCalendarioMensal(QDialog):
         
         # Area de atividades do dia selecionado
         self.label_data = QLabel("Selecione uma data para ver as atividades")
-        self.label_data.setStyleSheet("font-weight: bold; font-size: 13px; margin-top: 10px;")
+        self.label_data.setObjectName("labelDataCalendario")
         layout.addWidget(self.label_data)
         
         self.lista_atividades = QListWidget()
@@ -1193,7 +1453,7 @@ class DialogoCalendarioMensal(QDialog):
         
         layout_h.addWidget(QLabel("Legenda:"))
         
-        for nivel, cor in CORES_PRIORIDADE_VIBRANTE.items():
+        for nivel, cor in enumerate(CORES_PRIORIDADE_VIBRANTE):
             rotulo = QLabel(f"  P{nivel}")
             rotulo.setStyleSheet(f"color: {cor}; font-weight: bold;")
             layout_h.addWidget(rotulo)
@@ -1203,30 +1463,50 @@ class DialogoCalendarioMensal(QDialog):
     
     def _carregar_atividades(self) -> None:
         """Carrega as atividades e marca no calendário."""
-        # {dia_semana_index: [(horario, metadados), ...]}
-        self.atividades_por_dia = {}
-        
+        # Separadas já na carga: diárias valem para qualquer dia útil,
+        # então o 'é diária ou é da coluna certa?' por atividade some dos
+        # caminhos quentes de marcação e clique
+        self._diarias = []                  # [(horario, metadados), ...]
+        self._por_coluna = defaultdict(list)  # {dia_semana_index: [(horario, metadados), ...]}
+
         dados_grade = self.servico_horarios.obter_dados_grade()
-        
+
         for (horario, coluna), texto in dados_grade.items():
             if texto and texto.strip():
-                if coluna not in self.atividades_por_dia:
-                    self.atividades_por_dia[coluna] = []
-                
                 metadados = ExtratorMetadados.extrair_metadados(texto)
-                self.atividades_por_dia[coluna].append((horario, metadados))
-        
+                if metadados.periodicidade == "diaria":
+                    self._diarias.append((horario, metadados))
+                else:
+                    self._por_coluna[coluna].append((horario, metadados))
+
         # Ordenar por horário
-        for coluna in self.atividades_por_dia:
-            self.atividades_por_dia[coluna].sort(key=lambda x: x[0])
-        
+        self._diarias.sort(key=lambda x: x[0])
+        for atividades in self._por_coluna.values():
+            atividades.sort(key=lambda x: x[0])
+
         self._marcar_datas_calendario()
     
     def _marcar_datas_calendario(self) -> None:
         """Marca as datas que têm atividades no calendário com cor da maior prioridade."""
         mes_exibido = self.calendario.monthShown()
         ano_exibido = self.calendario.yearShown()
-        
+
+        # Marcação desejada da janela visível, calculada por inteiro antes
+        # de tocar o widget — o diff contra _datas_marcadas decide o que
+        # limpar, o que repintar e o que já está certo
+        novas_marcas = {}
+
+        def acumular(candidatas: list, atividades: list) -> None:
+            for horario, metadados in atividades:
+                validade = ExtratorMetadados.atividade_valida_para_datas(
+                    candidatas, metadados.periodicidade, metadados.data_criacao
+                )
+                for data_atual, valida in zip(candidatas, validade):
+                    if valida:
+                        atual = novas_marcas.get(data_atual)
+                        if atual is None or metadados.prioridade < atual:
+                            novas_marcas[data_atual] = metadados.prioridade
+
         # Marcar 3 meses: anterior, atual e próximo (para cobrir dias visíveis de meses adjacentes)
         for mes_offset in range(-1, 2):
             mes_total = mes_exibido + mes_offset
@@ -1240,48 +1520,51 @@ class DialogoCalendarioMensal(QDialog):
                 ano = ano_exibido
                 mes = mes_total
             
-            # Para cada dia do mês
-            for dia in range(1, 32):
-                try:
-                    data_atual = date(ano, mes, dia)
-                    dia_semana = data_atual.weekday()
-                    
-                    # Verificar se é dia útil (0-4 = seg-sex)
-                    if dia_semana < 5:
-                        # Coletar todas as prioridades válidas para esta data
-                        prioridades_do_dia = []
-                        
-                        # Para atividades diárias, verificar TODAS as colunas
-                        # Para outras periodicidades, verificar apenas a coluna do dia da semana
-                        for coluna, atividades in self.atividades_por_dia.items():
-                            for horario, metadados in atividades:
-                                if metadados.periodicidade == "diaria":
-                                    # Atividade diária aparece em todos os dias úteis a partir da criação
-                                    if ExtratorMetadados.atividade_valida_para_data(
-                                        data_atual, metadados.periodicidade, metadados.data_criacao
-                                    ):
-                                        prioridades_do_dia.append(metadados.prioridade)
-                                elif coluna == dia_semana:
-                                    # Outras atividades só aparecem no dia da semana correspondente
-                                    if ExtratorMetadados.atividade_valida_para_data(
-                                        data_atual, metadados.periodicidade, metadados.data_criacao
-                                    ):
-                                        prioridades_do_dia.append(metadados.prioridade)
-                        
-                        if prioridades_do_dia:
-                            # Usar a maior prioridade (menor número)
-                            maior_prioridade = min(prioridades_do_dia)
-                            cor_prioridade = CORES_PRIORIDADE_VIBRANTE.get(maior_prioridade, "#e8f4fd")
-                            
-                            formato_atividade = QTextCharFormat()
-                            formato_atividade.setBackground(QBrush(QColor(cor_prioridade)))
-                            formato_atividade.setForeground(QBrush(QColor("#ffffff")))
-                            formato_atividade.setFontWeight(QFont.Weight.Bold)
-                            
-                            qdate = QDate(ano, mes, dia)
-                            self.calendario.setDateTextFormat(qdate, formato_atividade)
-                except ValueError:
-                    break  # Dia inválido para o mês
+            # Dias úteis do mês, materializados uma vez; monthrange dá o
+            # último dia direto, sem sondar datas inválidas com exceção
+            ultimo_dia = calendar.monthrange(ano, mes)[1]
+            dias_uteis = [
+                data_atual
+                for data_atual in (date(ano, mes, dia) for dia in range(1, ultimo_dia + 1))
+                if data_atual.weekday() < 5
+            ]
+
+            if not dias_uteis:
+                continue
+
+            # Laço invertido: em vez de revalidar cada atividade dia a dia,
+            # cada atividade é avaliada sobre o mês inteiro em uma chamada
+            # de atividade_valida_para_datas (periodicidade e data de
+            # criação convertidas uma vez só), reduzindo as prioridades
+            # por data com min incremental. Diárias cobrem todos os dias
+            # úteis; as demais só os dias da coluna, filtrados uma vez por
+            # coluna em vez de por atividade
+            acumular(dias_uteis, self._diarias)
+            for coluna, atividades in self._por_coluna.items():
+                candidatas_coluna = [d for d in dias_uteis if d.weekday() == coluna]
+                if candidatas_coluna:
+                    acumular(candidatas_coluna, atividades)
+
+        # Aplicar só o delta: limpar datas que deixaram de ter atividade,
+        # repintar as que mudaram de prioridade, pular as inalteradas
+        self.calendario.blockSignals(True)
+        try:
+            formato_vazio = QTextCharFormat()
+            for data_antiga in self._datas_marcadas.keys() - novas_marcas.keys():
+                qdate = QDate(data_antiga.year, data_antiga.month, data_antiga.day)
+                self.calendario.setDateTextFormat(qdate, formato_vazio)
+
+            for data_atual, maior_prioridade in novas_marcas.items():
+                if self._datas_marcadas.get(data_atual) == maior_prioridade:
+                    continue
+                qdate = QDate(data_atual.year, data_atual.month, data_atual.day)
+                self.calendario.setDateTextFormat(
+                    qdate, self._formatos_por_prioridade[maior_prioridade]
+                )
+        finally:
+            self.calendario.blockSignals(False)
+
+        self._datas_marcadas = novas_marcas
     
     def _ao_mudar_mes(self, ano: int, mes: int) -> None:
         """Callback ao mudar de mês no calendário."""
@@ -1298,26 +1581,19 @@ class DialogoCalendarioMensal(QDialog):
             self.label_data.setText(f"{data.strftime('%d/%m/%Y')} ({MSG_FIM_DE_SEMANA})")
             return
         
-        nome_dia = list(DiaDaSemana)[dia_semana].value
+        nome_dia = _DIAS_SEMANA[dia_semana].value
         self.label_data.setText(f"{data.strftime('%d/%m/%Y')} - {nome_dia}")
         
-        # Coletar todas as atividades válidas para esta data
+        # Coletar todas as atividades válidas para esta data: diárias mais
+        # as da coluna clicada, sem varrer as colunas dos outros dias
         atividades_validas = []
-        
-        for coluna, atividades in self.atividades_por_dia.items():
-            for horario, metadados in atividades:
-                if metadados.periodicidade == "diaria":
-                    # Atividade diária aparece em todos os dias úteis
-                    if ExtratorMetadados.atividade_valida_para_data(
-                        data, metadados.periodicidade, metadados.data_criacao
-                    ):
-                        atividades_validas.append((horario, metadados))
-                elif coluna == dia_semana:
-                    # Outras atividades só aparecem no dia da semana correspondente
-                    if ExtratorMetadados.atividade_valida_para_data(
-                        data, metadados.periodicidade, metadados.data_criacao
-                    ):
-                        atividades_validas.append((horario, metadados))
+
+        candidatas = self._diarias + self._por_coluna.get(dia_semana, [])
+        for horario, metadados in candidatas:
+            if ExtratorMetadados.atividade_valida_para_data(
+                data, metadados.periodicidade, metadados.data_criacao
+            ):
+                atividades_validas.append((horario, metadados))
         
         # Ordenar por horário
         atividades_validas.sort(key=lambda x: x[0])
@@ -1325,9 +1601,7 @@ class DialogoCalendarioMensal(QDialog):
         # Exibir atividades
         for horario, metadados in atividades_validas:
             item = QListWidgetItem(f"{horario} - {metadados.titulo}")
-            cor = CORES_PRIORIDADE_VIBRANTE.get(metadados.prioridade)
-            if cor:
-                item.setForeground(QColor(cor))
+            item.setForeground(_QCOLOR_VIBRANTE[metadados.prioridade])
             self.lista_atividades.addItem(item)
         
         if self.lista_atividades.count() == 0:
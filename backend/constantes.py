@@ -1,6 +1,8 @@
 """
 Constantes centralizadas do projeto - todas em PT-BR.
 """
+from functools import lru_cache
+from types import MappingProxyType
 
 # =============================================================================
 # APLICAÇÃO
@@ -197,63 +199,125 @@ ESTILO_DIALOGO_BOX_PREVIA = """
     }
 """
 
+# Folha única aplicada em DialogoBase: as regras são resolvidas por
+# objectName, então o Qt parseia o stylesheet uma vez por diálogo em vez
+# de um setStyleSheet por widget filho
+ESTILO_DIALOGO_COMBINADO = """
+    QLabel#tituloDialogo {
+        font-size: 16px;
+        font-weight: bold;
+        color: #6c5ce7;
+        padding-bottom: 5px;
+    }
+    QLabel#labelInputDialogo {
+        font-size: 14px;
+        font-weight: bold;
+        padding-right: 5px;
+        color: #dfe6e9;
+    }
+    QLabel#previaTituloDialogo {
+        font-weight: bold;
+        font-size: 12px;
+        color: #a29bfe;
+    }
+    QLabel#boxPreviaDialogo {
+        font-size: 18px;
+        font-weight: bold;
+        color: #dfe6e9;
+        border: 2px solid #6c5ce7;
+        border-radius: 6px;
+        background-color: rgba(30,30,30,0.85);
+        padding: 10px;
+        min-height: 20px;
+    }
+""" + ESTILO_SPINBOX
+
+# Folha complementar aplicada junto com o tema no nível da aplicação:
+# regras por objectName substituem os setStyleSheet widget a widget, então
+# o Qt parseia uma folha só em aplicar_tema em vez de um snippet por widget
+ESTILO_GLOBAL_COMPLEMENTO = """
+    QPushButton#botaoDestaqueAgenda {
+        background-color: #6c5ce7;
+        color: white;
+        border-radius: 4px;
+        padding: 6px;
+        font-weight: bold;
+    }
+    QPushButton#botaoDestaqueAgenda:hover {
+        background-color: #a29bfe;
+    }
+    QLabel#rotuloStatusColuna {
+        font-weight: bold;
+        margin-top: 10px;
+    }
+    QLabel#labelSemanaAgenda {
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QLabel#labelDataCalendario {
+        font-weight: bold;
+        font-size: 13px;
+        margin-top: 10px;
+    }
+"""
+
 # =============================================================================
 # CORES DE PRIORIDADE
 # =============================================================================
-CORES_PRIORIDADE_VIBRANTE = {
-    0: "#e74c3c",  # P0 - vermelho
-    1: "#f39c12",  # P1 - laranja
-    2: "#3498db",  # P2 - azul
-    3: "#27ae60",  # P3 - verde
-}
-
-CORES_PRIORIDADE_SUAVE = {
-    0: "#f8d7da",  # P0 - vermelho suave
-    1: "#fff3cd",  # P1 - amarelo suave
-    2: "#d1ecf1",  # P2 - azul claro suave
-    3: "#d4edda",  # P3 - verde suave
-}
-
-NOMES_PRIORIDADE = {
-    0: "Crítica",
-    1: "Alta",
-    2: "Média",
-    3: "Baixa",
-}
-
-DESCRICOES_PRIORIDADE = {
-    0: "P0 - Crítica",
-    1: "P1 - Alta",
-    2: "P2 - Média",
-    3: "P3 - Baixa",
-}
+# Tuplas indexadas pela própria prioridade (0-3): chaves contíguas a
+# partir de zero dispensam a tabela hash — o nível vira índice direto
+CORES_PRIORIDADE_VIBRANTE = (
+    "#e74c3c",  # P0 - vermelho
+    "#f39c12",  # P1 - laranja
+    "#3498db",  # P2 - azul
+    "#27ae60",  # P3 - verde
+)
+
+CORES_PRIORIDADE_SUAVE = (
+    "#f8d7da",  # P0 - vermelho suave
+    "#fff3cd",  # P1 - amarelo suave
+    "#d1ecf1",  # P2 - azul claro suave
+    "#d4edda",  # P3 - verde suave
+)
+
+NOMES_PRIORIDADE = (
+    "Crítica",
+    "Alta",
+    "Média",
+    "Baixa",
+)
+
+DESCRICOES_PRIORIDADE = (
+    "P0 - Crítica",
+    "P1 - Alta",
+    "P2 - Média",
+    "P3 - Baixa",
+)
 
 # =============================================================================
 # PERIODICIDADE
 # =============================================================================
-NOMES_PERIODICIDADE = {
-    "unica": "Única",
-    "diaria": "Diária",
-    "semanal": "Semanal",
-    "quinzenal": "Quinzenal",
-    "mensal": "Mensal",
-}
-
-LISTA_PERIODICIDADES = [
+# Fonte única das periodicidades; os mapas abaixo derivam daqui, então
+# acrescentar uma entrada não exige manter três estruturas em sincronia
+LISTA_PERIODICIDADES = (
     ("unica", "Única vez"),
     ("diaria", "Diária"),
     ("semanal", "Semanal"),
     ("quinzenal", "Quinzenal"),
     ("mensal", "Mensal"),
-]
+)
 
-INDICE_PERIODICIDADE = {
-    "unica": 0,
-    "diaria": 1,
-    "semanal": 2,
-    "quinzenal": 3,
-    "mensal": 4,
-}
+# Rótulos curtos para tooltips: iguais aos do combo, exceto "unica"
+_NOMES_CURTOS_PERIODICIDADE = {"unica": "Única"}
+
+NOMES_PERIODICIDADE = MappingProxyType({
+    codigo: _NOMES_CURTOS_PERIODICIDADE.get(codigo, nome)
+    for codigo, nome in LISTA_PERIODICIDADES
+})
+
+INDICE_PERIODICIDADE = MappingProxyType({
+    codigo: indice for indice, (codigo, _) in enumerate(LISTA_PERIODICIDADES)
+})
 
 # =============================================================================
 # MENSAGENS DO SISTEMA
@@ -281,5 +345,29 @@ MSG_NENHUMA_ATIVIDADE_DIA = "Nenhuma atividade em {dia}"
 TOOLTIP_TAREFA_AGENDA = "Tarefa gerada automaticamente da Agenda\nPrioridade: P{prioridade}"
 TOOLTIP_TAREFA_MANUAL = "Prioridade: P{prioridade}"
 TOOLTIP_ATIVIDADE = "Prioridade: P{prioridade} - {nome_prioridade}\nPeriodicidade: {periodicidade}\nCriado em: {data}"
+
+# Só existem 4 prioridades, então as variantes ficam prontas no import:
+# o render de cada cartão indexa a tupla em vez de chamar .format()
+TOOLTIP_TAREFA_AGENDA_POR_PRIO = tuple(
+    TOOLTIP_TAREFA_AGENDA.format(prioridade=p) for p in range(len(NOMES_PRIORIDADE))
+)
+TOOLTIP_TAREFA_MANUAL_POR_PRIO = tuple(
+    TOOLTIP_TAREFA_MANUAL.format(prioridade=p) for p in range(len(NOMES_PRIORIDADE))
+)
+
+
+@lru_cache(maxsize=512)
+def montar_tooltip_atividade(prioridade, nome_prioridade, periodicidade, data):
+    """Monta o tooltip de atividade da grade.
+
+    Equivalente a TOOLTIP_ATIVIDADE.format(...), mas com f-string e
+    memoização: a grade repete as mesmas combinações a cada recarga, então
+    o texto só é montado na primeira vez que cada uma aparece.
+    """
+    return (
+        f"Prioridade: P{prioridade} - {nome_prioridade}\n"
+        f"Periodicidade: {periodicidade}\n"
+        f"Criado em: {data}"
+    )
 TOOLTIP_SINCRONIZAR = "Sincroniza as atividades do dia atual para o quadro Kanban"
 
@@ -2,11 +2,29 @@
 Ferramentas de desenvolvimento para edição de UI em tempo real.
 Execute: python dev_tools.py
 """
+import re
 import sys
+from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
+
+
+def _escolher_ferramenta() -> str:
+    """Pergunta qual ferramenta abrir (antes de carregar o PyQt6)."""
+    print("\n🎨 Dev Tools - Escolha uma opção:")
+    print("1. Editor de UI em Tempo Real (padrão)")
+    print("2. Hot Reload Watcher (observa arquivos)")
+    return input("\nOpção (1/2): ").strip() or "1"
+
+
+# O prompt roda antes dos imports do PyQt6 para que o menu apareça
+# imediatamente, sem esperar o carregamento dos plugins do Qt.
+_ESCOLHA_INICIAL = _escolher_ferramenta() if __name__ == "__main__" else "1"
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QTextEdit, QPushButton, QLabel, QSpinBox, QColorDialog,
+    QTabWidget, QTextEdit, QPlainTextEdit, QPushButton, QLabel, QSpinBox,
+    QColorDialog,
     QSlider, QGroupBox, QFormLayout, QLineEdit, QComboBox, QSplitter,
     QScrollArea, QFrame
 )
@@ -15,7 +33,89 @@ from PyQt6.QtGui import QFont, QColor
 
 # Importar componentes do projeto
 from componentes_ui import DialogoHorario, DialogoTarefa, BotaoEstilizado
-from constantes import *
+import constantes
+
+
+# Valida cores #RRGGBB (formas curtas como #rgb são rejeitadas sem exceção)
+_PADRAO_HEX6 = re.compile(r'^#?([0-9a-fA-F]{6})$')
+
+
+@lru_cache(maxsize=64)
+def _cor_escura(hex_cor: str) -> bool:
+    """Verifica se uma cor hexadecimal (#RRGGBB) é escura."""
+    correspondencia = _PADRAO_HEX6.match(hex_cor)
+    if not correspondencia:
+        return False
+    valor = int(correspondencia.group(1), 16)
+    r, g, b = valor >> 16, (valor >> 8) & 0xFF, valor & 0xFF
+    # Luminância em ponto fixo: equivale a (0.299r + 0.587g + 0.114b)/255 < 0.5
+    return (299 * r + 587 * g + 114 * b) < 127500
+
+
+# Esqueleto do QSS de "Aplicar Cores"; formatado uma única vez por mudança real
+_QSS_TEMPLATE_CORES = """
+    QDialog, QWidget {{
+        background-color: {fundo};
+        color: {texto};
+    }}
+    QPushButton {{
+        background-color: {primaria};
+        color: white;
+        border-radius: {radius}px;
+        padding: {padding}px;
+    }}
+    QPushButton:hover {{
+        background-color: {secundaria};
+    }}
+    QSpinBox {{
+        border: 2px solid {borda};
+        border-radius: {radius}px;
+        padding: {padding}px;
+        background-color: {fundo};
+        color: {texto};
+    }}
+    QLabel {{
+        color: {texto};
+    }}
+"""
+
+
+@lru_cache(maxsize=128)
+def _estilo_botao_cor(hex_cor: str) -> str:
+    """Retorna o stylesheet do botão de cor, cacheado por valor hexadecimal."""
+    texto = 'white' if _cor_escura(hex_cor) else 'black'
+    return f"background-color: {hex_cor}; color: {texto}; padding: 8px;"
+
+
+# QSS dos temas do painel de preview; strings idênticas a cada troca
+# permitem ao Qt reaproveitar o estado de parse em cache
+_TEMAS_PREVIEW = {
+    "Escuro": "background-color: #2d3436; border-radius: 10px;",
+    "Claro": "background-color: #f5f5f5; border-radius: 10px;",
+}
+
+# Conteúdo inicial do editor QSS, montado uma única vez no import
+_CSS_INICIAL = f"""/* Estilos do DialogoHorario */
+{constantes.ESTILO_DIALOGO_TITULO}
+
+{constantes.ESTILO_DIALOGO_LABEL_INPUT}
+
+{constantes.ESTILO_DIALOGO_BOX_PREVIA}
+
+{constantes.ESTILO_SPINBOX}
+
+{constantes.ESTILO_BOTAO_ADICIONAR_HORARIO}
+"""
+
+_FONTES_CONSOLAS: dict = {}
+
+
+def _fonte_consolas(tamanho: int) -> QFont:
+    """Retorna uma QFont Consolas compartilhada, criada uma vez por tamanho."""
+    fonte = _FONTES_CONSOLAS.get(tamanho)
+    if fonte is None:
+        fonte = _FONTES_CONSOLAS[tamanho] = QFont("Consolas", tamanho)
+    return fonte
 
 
 class EditorEstilosTempoReal(QMainWindow):
@@ -28,7 +128,19 @@ class EditorEstilosTempoReal(QMainWindow):
         
         # Widget de preview atual
         self.preview_widget = None
-        
+
+        # Coalescem rajadas de valueChanged (arrasto/tecla pressionada) em
+        # no máximo uma aplicação por intervalo
+        self._timer_dimensoes = QTimer(self)
+        self._timer_dimensoes.setSingleShot(True)
+        self._timer_dimensoes.setInterval(16)
+        self._timer_dimensoes.timeout.connect(self._aplicar_dimensoes)
+
+        self._timer_cores = QTimer(self)
+        self._timer_cores.setSingleShot(True)
+        self._timer_cores.setInterval(32)
+        self._timer_cores.timeout.connect(self._aplicar_cores)
+
         self._configurar_interface()
         self._carregar_estilos_atuais()
         
@@ -109,43 +221,43 @@ class EditorEstilosTempoReal(QMainWindow):
         # Largura do diálogo
         self.spin_largura = QSpinBox()
         self.spin_largura.setRange(200, 1000)
-        self.spin_largura.setValue(LARGURA_DIALOGO_HORARIO)
-        self.spin_largura.valueChanged.connect(self._aplicar_dimensoes)
+        self.spin_largura.setValue(constantes.LARGURA_DIALOGO_HORARIO)
+        self.spin_largura.valueChanged.connect(self._agendar_dimensoes)
         layout.addRow("Largura Diálogo:", self.spin_largura)
         
         # Altura do diálogo
         self.spin_altura = QSpinBox()
         self.spin_altura.setRange(200, 800)
-        self.spin_altura.setValue(ALTURA_DIALOGO_HORARIO)
-        self.spin_altura.valueChanged.connect(self._aplicar_dimensoes)
+        self.spin_altura.setValue(constantes.ALTURA_DIALOGO_HORARIO)
+        self.spin_altura.valueChanged.connect(self._agendar_dimensoes)
         layout.addRow("Altura Diálogo:", self.spin_altura)
         
         # Tamanho da fonte
         self.spin_fonte = QSpinBox()
         self.spin_fonte.setRange(8, 36)
         self.spin_fonte.setValue(16)
-        self.spin_fonte.valueChanged.connect(self._aplicar_dimensoes)
+        self.spin_fonte.valueChanged.connect(self._agendar_dimensoes)
         layout.addRow("Tamanho Fonte:", self.spin_fonte)
         
         # Padding
         self.spin_padding = QSpinBox()
         self.spin_padding.setRange(0, 50)
         self.spin_padding.setValue(10)
-        self.spin_padding.valueChanged.connect(self._aplicar_dimensoes)
+        self.spin_padding.valueChanged.connect(self._agendar_dimensoes)
         layout.addRow("Padding:", self.spin_padding)
         
         # Border radius
         self.spin_border_radius = QSpinBox()
         self.spin_border_radius.setRange(0, 30)
         self.spin_border_radius.setValue(8)
-        self.spin_border_radius.valueChanged.connect(self._aplicar_dimensoes)
+        self.spin_border_radius.valueChanged.connect(self._agendar_dimensoes)
         layout.addRow("Border Radius:", self.spin_border_radius)
         
         # Spacing
         self.spin_spacing = QSpinBox()
         self.spin_spacing.setRange(0, 50)
         self.spin_spacing.setValue(15)
-        self.spin_spacing.valueChanged.connect(self._aplicar_dimensoes)
+        self.spin_spacing.valueChanged.connect(self._agendar_dimensoes)
         layout.addRow("Spacing:", self.spin_spacing)
         
         return widget
@@ -166,26 +278,22 @@ class EditorEstilosTempoReal(QMainWindow):
         }
         
         self.botoes_cores = {}
-        
+
+        # QFormLayout resolve os pares rótulo/botão em uma única passada,
+        # sem negociação de largura por linha
+        form = QFormLayout()
         for nome, cor in self.cores.items():
-            grupo = QHBoxLayout()
-            
-            label = QLabel(nome + ":")
-            label.setMinimumWidth(120)
-            grupo.addWidget(label)
-            
             btn = QPushButton(cor)
-            btn.setStyleSheet(f"background-color: {cor}; color: {'white' if self._cor_escura(cor) else 'black'}; padding: 8px;")
-            btn.clicked.connect(lambda checked, n=nome: self._escolher_cor(n))
+            btn.setStyleSheet(_estilo_botao_cor(cor))
+            btn.clicked.connect(partial(self._ao_clicar_botao_cor, nome))
             self.botoes_cores[nome] = btn
-            grupo.addWidget(btn)
-            
-            layout.addLayout(grupo)
-        
+            form.addRow(nome + ":", btn)
+
+        layout.addLayout(form)
         layout.addStretch()
         
         btn_aplicar = QPushButton("✨ Aplicar Cores ao Preview")
-        btn_aplicar.clicked.connect(self._aplicar_cores)
+        btn_aplicar.clicked.connect(self._agendar_cores)
         layout.addWidget(btn_aplicar)
         
         return widget
@@ -199,7 +307,7 @@ class EditorEstilosTempoReal(QMainWindow):
         layout.addWidget(label)
         
         self.editor_css = QTextEdit()
-        self.editor_css.setFont(QFont("Consolas", 11))
+        self.editor_css.setFont(_fonte_consolas(11))
         self.editor_css.setPlaceholderText("/* Escreva seu QSS aqui */")
         layout.addWidget(self.editor_css)
         
@@ -234,13 +342,13 @@ class EditorEstilosTempoReal(QMainWindow):
         
         # Mostrar constantes relevantes do projeto
         constantes_ui = [
-            ("LARGURA_DIALOGO_HORARIO", LARGURA_DIALOGO_HORARIO),
-            ("ALTURA_DIALOGO_HORARIO", ALTURA_DIALOGO_HORARIO),
-            ("LARGURA_DIALOGO_TAREFA", LARGURA_DIALOGO_TAREFA),
-            ("ALTURA_DIALOGO_TAREFA", ALTURA_DIALOGO_TAREFA),
-            ("DURACAO_FADE_IN", DURACAO_FADE_IN),
-            ("DURACAO_RIPPLE", DURACAO_RIPPLE),
-            ("RAIO_DESFOQUE_SOMBRA", RAIO_DESFOQUE_SOMBRA),
+            ("LARGURA_DIALOGO_HORARIO", constantes.LARGURA_DIALOGO_HORARIO),
+            ("ALTURA_DIALOGO_HORARIO", constantes.ALTURA_DIALOGO_HORARIO),
+            ("LARGURA_DIALOGO_TAREFA", constantes.LARGURA_DIALOGO_TAREFA),
+            ("ALTURA_DIALOGO_TAREFA", constantes.ALTURA_DIALOGO_TAREFA),
+            ("DURACAO_FADE_IN", constantes.DURACAO_FADE_IN),
+            ("DURACAO_RIPPLE", constantes.DURACAO_RIPPLE),
+            ("RAIO_DESFOQUE_SOMBRA", constantes.RAIO_DESFOQUE_SOMBRA),
         ]
         
         self.campos_constantes = {}
@@ -286,7 +394,8 @@ class EditorEstilosTempoReal(QMainWindow):
         # Área de preview
         self.area_preview = QFrame()
         self.area_preview.setFrameStyle(QFrame.Shape.StyledPanel)
-        self.area_preview.setStyleSheet("background-color: #2d3436; border-radius: 10px;")
+        self.area_preview.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.area_preview.setStyleSheet(_TEMAS_PREVIEW["Escuro"])
         self.layout_preview = QVBoxLayout(self.area_preview)
         self.layout_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
@@ -321,7 +430,7 @@ class EditorEstilosTempoReal(QMainWindow):
                 container = QWidget()
                 layout = QVBoxLayout(container)
                 btn = BotaoEstilizado("Botão Estilizado")
-                btn.setStyleSheet(ESTILO_BOTAO_ADICIONAR_HORARIO)
+                btn.setStyleSheet(constantes.ESTILO_BOTAO_ADICIONAR_HORARIO)
                 layout.addWidget(btn)
                 self.preview_widget = container
             
@@ -332,6 +441,14 @@ class EditorEstilosTempoReal(QMainWindow):
         except Exception as e:
             self.label_info.setText(f"❌ Erro: {str(e)}")
     
+    def _agendar_dimensoes(self):
+        """Agenda a aplicação de dimensões, colapsando rajadas de sinais."""
+        self._timer_dimensoes.start()
+
+    def _agendar_cores(self):
+        """Agenda a aplicação de cores, colapsando rajadas de sinais."""
+        self._timer_cores.start()
+
     def _aplicar_dimensoes(self):
         """Aplica as dimensões ao preview."""
         if self.preview_widget and hasattr(self.preview_widget, 'setFixedSize'):
@@ -340,6 +457,10 @@ class EditorEstilosTempoReal(QMainWindow):
                 self.spin_altura.value()
             )
     
+    def _ao_clicar_botao_cor(self, nome_cor: str, checked: bool = False):
+        """Slot de clique dos botões de cor (descarta o argumento checked)."""
+        self._escolher_cor(nome_cor)
+
     def _escolher_cor(self, nome_cor: str):
         """Abre diálogo para escolher cor."""
         cor_atual = QColor(self.cores[nome_cor])
@@ -350,46 +471,35 @@ class EditorEstilosTempoReal(QMainWindow):
             self.cores[nome_cor] = hex_cor
             btn = self.botoes_cores[nome_cor]
             btn.setText(hex_cor)
-            btn.setStyleSheet(f"background-color: {hex_cor}; color: {'white' if self._cor_escura(hex_cor) else 'black'}; padding: 8px;")
+            btn.setStyleSheet(_estilo_botao_cor(hex_cor))
     
     def _cor_escura(self, hex_cor: str) -> bool:
         """Verifica se uma cor é escura."""
-        hex_cor = hex_cor.lstrip('#')
-        r, g, b = int(hex_cor[0:2], 16), int(hex_cor[2:4], 16), int(hex_cor[4:6], 16)
-        luminosidade = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        return luminosidade < 0.5
+        return _cor_escura(hex_cor)
     
     def _aplicar_cores(self):
         """Aplica as cores ao preview."""
-        css = f"""
-            QDialog, QWidget {{
-                background-color: {self.cores['Cor de Fundo']};
-                color: {self.cores['Cor do Texto']};
-            }}
-            QPushButton {{
-                background-color: {self.cores['Cor Primária']};
-                color: white;
-                border-radius: {self.spin_border_radius.value()}px;
-                padding: {self.spin_padding.value()}px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.cores['Cor Secundária']};
-            }}
-            QSpinBox {{
-                border: 2px solid {self.cores['Cor da Borda']};
-                border-radius: {self.spin_border_radius.value()}px;
-                padding: {self.spin_padding.value()}px;
-                background-color: {self.cores['Cor de Fundo']};
-                color: {self.cores['Cor do Texto']};
-            }}
-            QLabel {{
-                color: {self.cores['Cor do Texto']};
-            }}
-        """
-        
+        parametros = {
+            'fundo': self.cores['Cor de Fundo'],
+            'texto': self.cores['Cor do Texto'],
+            'primaria': self.cores['Cor Primária'],
+            'secundaria': self.cores['Cor Secundária'],
+            'borda': self.cores['Cor da Borda'],
+            'radius': self.spin_border_radius.value(),
+            'padding': self.spin_padding.value(),
+        }
+
+        # Evitar reformatar e reaplicar o QSS quando nada mudou de fato
+        chave = tuple(parametros.values())
+        if chave == getattr(self, '_ultima_chave_qss', None):
+            return
+        self._ultima_chave_qss = chave
+
+        css = _QSS_TEMPLATE_CORES.format_map(parametros)
+
         if self.preview_widget:
             self.preview_widget.setStyleSheet(css)
-        
+
         self.editor_css.setPlainText(css)
     
     def _aplicar_css_personalizado(self):
@@ -411,33 +521,19 @@ class EditorEstilosTempoReal(QMainWindow):
     
     def _mudar_tema_preview(self, tema: str):
         """Muda o tema do preview."""
-        if tema == "Escuro":
-            self.area_preview.setStyleSheet("background-color: #2d3436; border-radius: 10px;")
-        else:
-            self.area_preview.setStyleSheet("background-color: #f5f5f5; border-radius: 10px;")
+        self.area_preview.setStyleSheet(_TEMAS_PREVIEW.get(tema, _TEMAS_PREVIEW["Escuro"]))
     
     def _carregar_estilos_atuais(self):
         """Carrega os estilos atuais no editor."""
-        css_inicial = f"""/* Estilos do DialogoHorario */
-{ESTILO_DIALOGO_TITULO}
-
-{ESTILO_DIALOGO_LABEL_INPUT}
-
-{ESTILO_DIALOGO_BOX_PREVIA}
-
-{ESTILO_SPINBOX}
-
-{ESTILO_BOTAO_ADICIONAR_HORARIO}
-"""
-        self.editor_css.setPlainText(css_inicial)
+        self.editor_css.setPlainText(_CSS_INICIAL)
     
     def _gerar_codigo_constantes(self):
         """Gera código Python com as constantes editadas."""
-        codigo = "# Constantes geradas pelo Dev Tools\n\n"
-        
-        for nome, spin in self.campos_constantes.items():
-            codigo += f"{nome} = {spin.value()}\n"
-        
+        codigo = "# Constantes geradas pelo Dev Tools\n\n" + "\n".join(
+            f"{nome} = {spin.value()}"
+            for nome, spin in self.campos_constantes.items()
+        ) + "\n"
+
         self.editor_css.setPlainText(codigo)
         self.label_info.setText("📄 Código Python gerado! Copie do editor QSS.")
 
@@ -451,10 +547,18 @@ class HotReloadWatcher(QMainWindow):
         super().__init__()
         self.setWindowTitle("🔥 Hot Reload - QSS Watcher")
         self.resize(800, 600)
-        
+
         self.watcher = QFileSystemWatcher()
         self.watcher.fileChanged.connect(self._arquivo_modificado)
-        
+
+        # Debounce: editores emitem rajadas de fileChanged por salvamento;
+        # acumula os caminhos e processa tudo de uma vez após a pausa.
+        self._caminhos_pendentes: set = set()
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._processar_mudancas)
+
         self._configurar_interface()
         self._adicionar_arquivos_observados()
     
@@ -467,9 +571,12 @@ class HotReloadWatcher(QMainWindow):
         label.setStyleSheet("font-size: 14px; padding: 10px;")
         layout.addWidget(label)
         
-        self.log = QTextEdit()
+        # QPlainTextEdit com limite de blocos: custo de layout por linha e
+        # descarte automático das linhas antigas em sessões longas
+        self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
-        self.log.setFont(QFont("Consolas", 10))
+        self.log.setMaximumBlockCount(500)
+        self.log.setFont(_fonte_consolas(10))
         layout.addWidget(self.log)
         
         self.preview = DialogoHorario()
@@ -490,17 +597,42 @@ class HotReloadWatcher(QMainWindow):
                 self._log(f"👁️ Observando: {arq}")
     
     def _arquivo_modificado(self, path: str):
-        self._log(f"Arquivo modificado: {Path(path).name}")
-        
-        # Recarregar módulo de constantes
-        if "constantes" in path:
+        self._caminhos_pendentes.add(path)
+        # Reiniciar o timer colapsa a rajada de eventos em um único processamento
+        self._debounce.start()
+
+    def _processar_mudancas(self):
+        caminhos = self._caminhos_pendentes
+        self._caminhos_pendentes = set()
+
+        for path in caminhos:
+            self._log(f"Arquivo modificado: {Path(path).name}")
+
+        # Recarregar módulo de constantes (uma única vez por rajada)
+        constantes_mudou = any("constantes" in path for path in caminhos)
+        if constantes_mudou:
             import importlib
-            import constantes
             importlib.reload(constantes)
             self._log("✅ Constantes recarregadas!")
-        
-        # Recarregar preview
-        QTimer.singleShot(100, self._recarregar_preview)
+
+        # Alguns editores substituem o arquivo ao salvar e o Qt perde o watch
+        for path in caminhos:
+            if path not in self.watcher.files() and Path(path).exists():
+                self.watcher.addPath(path)
+
+        # Reconstruir o widget só quando as constantes mudam (dimensões são
+        # fixadas no __init__); para mudanças só de QSS basta reaplicar o estilo
+        if constantes_mudou:
+            self._recarregar_preview()
+        else:
+            self._reaplicar_qss([p for p in caminhos if p.endswith('.qss')])
+
+    def _reaplicar_qss(self, caminhos_qss: list):
+        for path in caminhos_qss:
+            arquivo = Path(path)
+            if arquivo.exists():
+                self.preview.setStyleSheet(arquivo.read_text(encoding='utf-8'))
+                self._log(f"✅ QSS reaplicado: {arquivo.name}")
     
     def _recarregar_preview(self):
         # Recriar o preview com novos estilos
@@ -512,23 +644,15 @@ class HotReloadWatcher(QMainWindow):
         self._log("✅ Preview atualizado!")
     
     def _log(self, msg: str):
-        from datetime import datetime
-        self.log.append(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
+        self.log.appendPlainText(f"[{datetime.now().strftime('%H:%M:%S')}] {msg}")
 
 
 def main():
     """Inicia o editor de UI em tempo real."""
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
-    
-    # Escolher ferramenta
-    print("\n🎨 Dev Tools - Escolha uma opção:")
-    print("1. Editor de UI em Tempo Real (padrão)")
-    print("2. Hot Reload Watcher (observa arquivos)")
-    
-    escolha = input("\nOpção (1/2): ").strip() or "1"
-    
-    if escolha == "2":
+
+    if _ESCOLHA_INICIAL == "2":
         janela = HotReloadWatcher()
     else:
         janela = EditorEstilosTempoReal()
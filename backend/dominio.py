@@ -5,8 +5,9 @@ Totalmente em PT-BR.
 import re
 from enum import Enum
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
-from datetime import date, timedelta
+from datetime import date, datetime
 
 
 class StatusTarefa(Enum):
@@ -25,6 +26,12 @@ class DiaDaSemana(Enum):
     SEXTA = "Sexta-Feira"
 
 
+# Ordem dos dias materializada uma vez: iterar a tupla evita o protocolo
+# de iteração do Enum (e o .value por membro) nos consumidores
+DIAS_DA_SEMANA = tuple(DiaDaSemana)
+DIAS_DA_SEMANA_VALORES = tuple(dia.value for dia in DIAS_DA_SEMANA)
+
+
 class Prioridade(Enum):
     """Níveis de prioridade das tarefas."""
     P0 = (0, "P0", "#e74c3c", "Crítica")      # Vermelho
@@ -32,17 +39,17 @@ class Prioridade(Enum):
     P2 = (2, "P2", "#f1c40f", "Média")        # Amarelo
     P3 = (3, "P3", "#3498db", "Baixa")        # Azul
     
-    def __init__(self, nivel: int, codigo: str, cor: str, descricao: str):
-        self.nivel = nivel
-        self.codigo = codigo
-        self.cor = cor
-        self.descricao = descricao
-    
-    @property
-    def value(self) -> int:
-        """Retorna o nível numérico como valor."""
-        return self.nivel
-    
+    def __new__(cls, nivel: int, codigo: str, cor: str, descricao: str) -> 'Prioridade':
+        # Definir _value_ = nivel no __new__ (executado uma vez por membro)
+        # dispensa a property 'value' e deixa .value como leitura direta
+        obj = object.__new__(cls)
+        obj._value_ = nivel
+        obj.nivel = nivel
+        obj.codigo = codigo
+        obj.cor = cor
+        obj.descricao = descricao
+        return obj
+
     def obter_cor(self) -> str:
         """Retorna a cor hexadecimal da prioridade."""
         return self.cor
@@ -50,10 +57,15 @@ class Prioridade(Enum):
     @classmethod
     def from_nivel(cls, nivel: int) -> 'Prioridade':
         """Retorna a prioridade pelo nível numérico."""
-        for p in cls:
-            if p.nivel == nivel:
-                return p
-        return cls.P3  # Padrão
+        return _PRIORIDADE_POR_NIVEL.get(nivel, cls.P3)
+
+
+# Mapeamento pré-computado para conversão O(1) (usado em cada linha do banco)
+_PRIORIDADE_POR_NIVEL = {p.nivel: p for p in Prioridade}
+
+# Cores indexadas pelo nível, para o caminho de renderização por cartão
+# (evita o round-trip from_nivel(n).obter_cor() em loops de pintura)
+CORES_POR_NIVEL = tuple(p.cor for p in Prioridade)
 
 
 # =============================================================================
@@ -82,17 +94,18 @@ class Periodicidade(Enum):
     @classmethod
     def from_codigo(cls, codigo: str) -> 'Periodicidade':
         """Retorna a periodicidade pelo código."""
-        for periodicidade in cls:
-            if periodicidade.codigo == codigo:
-                return periodicidade
-        return cls.SEMANAL  # Padrão
+        return _PERIODICIDADE_POR_CODIGO.get(codigo, cls.SEMANAL)
+
+
+# Mapeamento pré-computado para conversão O(1)
+_PERIODICIDADE_POR_CODIGO = {p.codigo: p for p in Periodicidade}
 
 
 # =============================================================================
 # OBJETOS DE TRANSFERÊNCIA DE DADOS (DTOs)
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TarefaDTO:
     """
     Objeto de transferência de dados para Tarefas do Kanban.
@@ -119,7 +132,7 @@ class TarefaDTO:
     data_criacao: Optional[str] = field(default=None)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AtividadeAgendaDTO:
     """
     Objeto de transferência de dados para Atividades da Agenda Semanal.
@@ -148,73 +161,99 @@ class AtividadeAgendaDTO:
 # =============================================================================
 # FUNÇÕES CONVERSORAS
 # =============================================================================
+
+# Mapeamentos pré-computados para conversão O(1)
+_DIA_POR_VALOR = {d.value: d for d in DiaDaSemana}
+_STATUS_POR_VALOR = {s.value: s for s in StatusTarefa}
+
+
 def converter_string_para_dia(dia_str: str) -> Optional[DiaDaSemana]:
     """Converte string para enum DiaDaSemana.
-    
+
     Args:
         dia_str: Nome do dia da semana (ex: 'Segunda-Feira')
-        
+
     Returns:
         DiaDaSemana correspondente ou None se não encontrado
     """
-    for dia in DiaDaSemana:
-        if dia.value == dia_str:
-            return dia
-    return None
+    return _DIA_POR_VALOR.get(dia_str)
 
 
 def converter_string_para_status(status_str: str) -> Optional[StatusTarefa]:
     """Converte string para enum StatusTarefa.
-    
+
     Args:
         status_str: Nome do status (ex: 'Fazer')
-        
+
     Returns:
         StatusTarefa correspondente ou None se não encontrado
     """
-    for status in StatusTarefa:
-        if status.value == status_str:
-            return status
-    return None
+    return _STATUS_POR_VALOR.get(status_str)
+
+
+# Tupla indexada por weekday() (0=Segunda ... 6=Domingo); fim de semana = None
+_DIAS_POR_WEEKDAY = (
+    DiaDaSemana.SEGUNDA,
+    DiaDaSemana.TERCA,
+    DiaDaSemana.QUARTA,
+    DiaDaSemana.QUINTA,
+    DiaDaSemana.SEXTA,
+    None,
+    None,
+)
 
 
 def obter_dia_semana_atual() -> Optional[DiaDaSemana]:
     """Retorna o dia da semana atual como enum.
-    
+
     Returns:
         DiaDaSemana correspondente ao dia atual ou None se for fim de semana
     """
-    from datetime import datetime
-    dia_numero = datetime.now().weekday()  # 0=Segunda, 6=Domingo
-    
-    mapa_dias = {
-        0: DiaDaSemana.SEGUNDA,
-        1: DiaDaSemana.TERCA,
-        2: DiaDaSemana.QUARTA,
-        3: DiaDaSemana.QUINTA,
-        4: DiaDaSemana.SEXTA,
-    }
-    
-    return mapa_dias.get(dia_numero)
+    return _DIAS_POR_WEEKDAY[datetime.now().weekday()]
+
+
+# Cache (data, iso) da data atual — isoformat() aloca uma string nova a cada
+# chamada e aparece em todo loop de sincronização/persistência
+_HOJE_CACHE: tuple[Optional[date], str] = (None, "")
+
+
+def hoje_iso() -> str:
+    """Retorna a data de hoje no formato ISO, cacheada até o dia virar.
+
+    Returns:
+        Data atual como 'YYYY-MM-DD'
+    """
+    global _HOJE_CACHE
+    hoje = date.today()
+    if hoje != _HOJE_CACHE[0]:
+        _HOJE_CACHE = (hoje, hoje.isoformat())
+    return _HOJE_CACHE[1]
 
 
 # =============================================================================
 # METADADOS DE ATIVIDADES
 # =============================================================================
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MetadadosAtividade:
     """
     Representa os metadados extraídos de uma atividade formatada.
     Encapsula prioridade, periodicidade, data de criação e título.
+    Imutável, como os DTOs — sem __dict__ por instância e hashável.
     """
     titulo: str
     prioridade: int = 3
     periodicidade: str = "semanal"
     data_criacao: Optional[date] = None
-    
+    # Forma textual da data de criação ('YYYY-MM-DD' ou ''), preenchida
+    # pelo parser: quem só exibe a data (tooltips) usa a string pronta em
+    # vez de refazer isoformat() a cada célula
+    data_criacao_iso: str = ""
+
     def para_texto_formatado(self) -> str:
         """Serializa os metadados para o formato de texto armazenado."""
-        data_str = self.data_criacao.isoformat() if self.data_criacao else date.today().isoformat()
+        data_str = self.data_criacao_iso or (
+            self.data_criacao.isoformat() if self.data_criacao else hoje_iso()
+        )
         return f"[P{self.prioridade}][{self.periodicidade}][{data_str}] {self.titulo}"
     
     @property
@@ -228,18 +267,71 @@ class MetadadosAtividade:
         return Periodicidade.from_codigo(self.periodicidade)
 
 
+# Códigos inteiros de periodicidade para o kernel de validação, derivados
+# da ordem de declaração do enum (0=unica, 1=diaria, 2=semanal,
+# 3=quinzenal, 4=mensal)
+_CODIGO_PERIODICIDADE = {p.codigo: i for i, p in enumerate(Periodicidade)}
+
+
+def _valida_ordinal(alvo_ord: int, criacao_ord: int, cod_per: int) -> bool:
+    """Kernel da validação de recorrência sobre ordinais e códigos inteiros.
+
+    Opera só com aritmética de inteiros (toordinal), sem criar objetos
+    date/timedelta intermediários — é o laço interno do calendário mensal.
+    O ordinal 1 é uma segunda-feira, logo weekday == (ordinal + 6) % 7 e a
+    semana do mês (0-based) de um dia D é (D - 1) // 7.
+    """
+    if alvo_ord < criacao_ord:
+        return False
+
+    # Primeira ocorrência: próximo ordinal com o mesmo weekday do alvo
+    primeira_ord = criacao_ord + (alvo_ord - criacao_ord) % 7
+
+    if cod_per == 0:    # unica
+        return alvo_ord == primeira_ord
+    if cod_per == 1:    # diaria (apenas dias úteis)
+        return (alvo_ord + 6) % 7 < 5
+    if cod_per == 2:    # semanal
+        return alvo_ord >= primeira_ord
+    if cod_per == 3:    # quinzenal
+        if alvo_ord < primeira_ord:
+            return False
+        return ((alvo_ord - primeira_ord) // 7) % 2 == 0
+    if cod_per == 4:    # mensal (mesma semana do mês)
+        if alvo_ord < primeira_ord:
+            return False
+        return ((date.fromordinal(primeira_ord).day - 1) // 7
+                == (date.fromordinal(alvo_ord).day - 1) // 7)
+    return False
+
+
 class ExtratorMetadados:
     """
     Classe utilitária para extrair e manipular metadados de atividades.
     Centraliza toda a lógica de parsing de texto formatado.
     """
     
-    # Padrões regex compilados para melhor performance
-    _PADRAO_PRIORIDADE = re.compile(r'\[P([0-3])\]', re.IGNORECASE)
-    _PADRAO_PERIODICIDADE = re.compile(r'\[(unica|diaria|semanal|quinzenal|mensal)\]', re.IGNORECASE)
-    _PADRAO_DATA = re.compile(r'\[(\d{4}-\d{2}-\d{2})\]')
-    _PADRAO_HORARIO = re.compile(r'^\s*\[(\d{2}:\d{2})\]\s*')
-    _PADRAO_METADADOS = re.compile(r'^\s*(\[[^\]]+\]\s*)+')
+    # Padrões regex compilados para melhor performance. Todos em re.ASCII
+    # (os tokens são ASCII puro, dispensa as tabelas Unicode de \d e \s).
+    # Prioridade e periodicidade mantêm IGNORECASE: além do texto canônico
+    # de formatar_atividade, as células da grade aceitam texto digitado à
+    # mão ([p1], [DIARIA]), que precisa parsear como no formato gerado.
+    _PADRAO_PRIORIDADE = re.compile(r'\[P([0-3])\]', re.IGNORECASE | re.ASCII)
+    _PADRAO_PERIODICIDADE = re.compile(
+        r'\[(unica|diaria|semanal|quinzenal|mensal)\]', re.IGNORECASE | re.ASCII
+    )
+    _PADRAO_DATA = re.compile(r'\[(\d{4}-\d{2}-\d{2})\]', re.ASCII)
+    _PADRAO_HORARIO = re.compile(r'^\s*\[(\d{2}:\d{2})\]\s*', re.ASCII)
+    _PADRAO_METADADOS = re.compile(r'^\s*(\[[^\]]+\]\s*)+', re.ASCII)
+    # Padrão fundido para o prefixo canônico gerado por formatar_atividade:
+    # [HH:MM]?[P#][periodicidade][YYYY-MM-DD] título — extrai tudo em uma passada
+    _PADRAO_COMBINADO = re.compile(
+        r'^\s*(?:\[(?P<hora>\d{2}:\d{2})\]\s*)?'
+        r'\[P(?P<prio>[0-3])\]'
+        r'\[(?P<per>unica|diaria|semanal|quinzenal|mensal)\]'
+        r'\[(?P<data>\d{4}-\d{2}-\d{2})\]\s*(?P<titulo>.*)$',
+        re.ASCII
+    )
     
     @classmethod
     def extrair_prioridade(cls, texto: str) -> int:
@@ -254,7 +346,11 @@ class ExtratorMetadados:
         """
         if not texto:
             return 3
-        
+
+        # Caminho rápido: texto canônico começa com [P#] — dispensa o regex
+        if texto.startswith('[P') and texto[3:4] == ']' and texto[2] in '0123':
+            return int(texto[2])
+
         correspondencia = cls._PADRAO_PRIORIDADE.search(texto)
         if correspondencia:
             return int(correspondencia.group(1))
@@ -351,11 +447,43 @@ class ExtratorMetadados:
         Returns:
             Objeto MetadadosAtividade com todos os dados extraídos
         """
+        return cls._extrair_campos(texto)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _extrair_campos(cls, texto: str) -> MetadadosAtividade:
+        """Extrai os metadados, memoizado por texto bruto.
+
+        Os mesmos textos são reparseados a cada repintura/sincronização.
+        Como MetadadosAtividade é congelado, a instância cacheada é
+        compartilhada diretamente entre as chamadas.
+        """
+        if texto:
+            # Caminho rápido: uma única passada para o prefixo canônico
+            correspondencia = cls._PADRAO_COMBINADO.match(texto)
+            if correspondencia:
+                data_iso = correspondencia.group('data')
+                try:
+                    data_criacao = date.fromisoformat(data_iso)
+                except ValueError:
+                    data_criacao = None
+                    data_iso = ""
+                return MetadadosAtividade(
+                    titulo=correspondencia.group('titulo').strip(),
+                    prioridade=int(correspondencia.group('prio')),
+                    periodicidade=correspondencia.group('per'),
+                    data_criacao=data_criacao,
+                    data_criacao_iso=data_iso
+                )
+
+        # Caminho lento: metadados parciais ou fora de ordem
+        data_criacao = cls.extrair_data_criacao(texto)
         return MetadadosAtividade(
             titulo=cls.extrair_titulo_limpo(texto),
             prioridade=cls.extrair_prioridade(texto),
             periodicidade=cls.extrair_periodicidade(texto),
-            data_criacao=cls.extrair_data_criacao(texto)
+            data_criacao=data_criacao,
+            data_criacao_iso=data_criacao.isoformat() if data_criacao else ""
         )
     
     @classmethod
@@ -378,7 +506,7 @@ class ExtratorMetadados:
         Returns:
             Texto formatado com metadados
         """
-        data_str = (data_criacao or date.today()).isoformat()
+        data_str = data_criacao.isoformat() if data_criacao else hoje_iso()
         return f"[P{prioridade}][{periodicidade}][{data_str}] {titulo}"
     
     @classmethod
@@ -401,46 +529,40 @@ class ExtratorMetadados:
         """
         if data_criacao is None:
             data_criacao = date.today()
-        
-        # Nunca mostrar em datas anteriores à criação
-        if data_alvo < data_criacao:
-            return False
-        
-        # Calcular primeira ocorrência
-        dias_ate_dia_semana = (data_alvo.weekday() - data_criacao.weekday()) % 7
-        if dias_ate_dia_semana == 0 and data_criacao.weekday() == data_alvo.weekday():
-            primeira_ocorrencia = data_criacao
-        else:
-            primeira_ocorrencia = data_criacao + timedelta(days=dias_ate_dia_semana)
-        
-        if periodicidade == "unica":
-            return data_alvo == primeira_ocorrencia
-        
-        elif periodicidade == "diaria":
-            return data_alvo >= data_criacao and data_alvo.weekday() < 5
-        
-        elif periodicidade == "semanal":
-            return data_alvo >= primeira_ocorrencia
-        
-        elif periodicidade == "quinzenal":
-            if data_alvo < primeira_ocorrencia:
-                return False
-            semanas_diff = (data_alvo - primeira_ocorrencia).days // 7
-            return semanas_diff % 2 == 0
-        
-        elif periodicidade == "mensal":
-            if data_alvo < primeira_ocorrencia:
-                return False
-            
-            def semana_do_mes(d: date) -> int:
-                primeiro_dia = date(d.year, d.month, 1)
-                primeiro_mesmo_dia_semana = primeiro_dia + timedelta(
-                    days=(d.weekday() - primeiro_dia.weekday()) % 7
-                )
-                return (d - primeiro_mesmo_dia_semana).days // 7
-            
-            return semana_do_mes(primeira_ocorrencia) == semana_do_mes(data_alvo)
-        
-        return False
+
+        return _valida_ordinal(
+            data_alvo.toordinal(),
+            data_criacao.toordinal(),
+            _CODIGO_PERIODICIDADE.get(periodicidade, -1),
+        )
+
+    @classmethod
+    def atividade_valida_para_datas(
+        cls,
+        datas_alvo: list[date],
+        periodicidade: str,
+        data_criacao: Optional[date] = None
+    ) -> list[bool]:
+        """
+        Versão em lote de atividade_valida_para_data para um intervalo.
+
+        Converte a periodicidade e a data de criação uma única vez e roda
+        o kernel inteiro por data — é o caminho usado para pintar um mês
+        inteiro do calendário de uma atividade só.
+
+        Args:
+            datas_alvo: Datas a verificar, em qualquer ordem
+            periodicidade: Código da periodicidade
+            data_criacao: Data de criação da atividade
+
+        Returns:
+            Lista de booleanos alinhada com datas_alvo
+        """
+        criacao_ord = (data_criacao or date.today()).toordinal()
+        cod_per = _CODIGO_PERIODICIDADE.get(periodicidade, -1)
+        return [
+            _valida_ordinal(d.toordinal(), criacao_ord, cod_per)
+            for d in datas_alvo
+        ]
 
 
@@ -4,38 +4,52 @@ Totalmente em PT-BR com melhor tratamento de erros.
 """
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+from constantes import ESTILO_GLOBAL_COMPLEMENTO
 
 logger = logging.getLogger(__name__)
 
 
 class GerenciadorEstilo:
     """Gerencia carregamento e aplicação de temas visuais."""
-    
+
     _DIRETORIO_TEMAS = Path(__file__).parent / "temas"
-    
+
+    # Conteúdo por arquivo de tema, preenchido na primeira leitura: os
+    # QSS não mudam em runtime, então alternar o tema devolve sempre a
+    # MESMA string (inclusive a vazia de arquivo ausente, sem re-stat) —
+    # e a identidade estável permite comparações baratas em quem aplica
+    _cache_temas: Dict[str, str] = {}
+
     @staticmethod
     def _carregar_arquivo_tema(nome_arquivo: str) -> str:
         """
-        Carrega o conteúdo de um arquivo de tema.
-        
+        Carrega o conteúdo de um arquivo de tema, com cache por arquivo.
+
         Args:
             nome_arquivo: Nome do arquivo de tema (ex: "claro.qss")
-            
+
         Returns:
             Conteúdo do arquivo de tema ou string vazia se não encontrado
         """
+        conteudo = GerenciadorEstilo._cache_temas.get(nome_arquivo)
+        if conteudo is not None:
+            return conteudo
+
         caminho = GerenciadorEstilo._DIRETORIO_TEMAS / nome_arquivo
         try:
             conteudo = caminho.read_text(encoding='utf-8')
             logger.info(f"Tema '{nome_arquivo}' carregado com sucesso")
-            return conteudo
         except FileNotFoundError:
             logger.warning(f"Arquivo de tema '{nome_arquivo}' não encontrado em {caminho}")
-            return ""
+            conteudo = ""
         except Exception as e:
             logger.error(f"Erro ao carregar tema '{nome_arquivo}': {e}")
-            return ""
+            conteudo = ""
+
+        GerenciadorEstilo._cache_temas[nome_arquivo] = conteudo
+        return conteudo
     
     @staticmethod
     def obter_tema_claro() -> str:
@@ -46,3 +60,29 @@ class GerenciadorEstilo:
     def obter_tema_escuro() -> str:
         """Retorna o stylesheet do tema escuro."""
         return GerenciadorEstilo._carregar_arquivo_tema("escuro.qss")
+
+    # Folha completa (tema + complemento global) por modo, composta uma
+    # vez: alternar o tema entrega sempre a mesma string ao Qt
+    _cache_folhas: Dict[bool, str] = {}
+
+    @staticmethod
+    def obter_folha_aplicacao(tema_escuro: bool) -> str:
+        """
+        Retorna a folha de estilos completa da aplicação para o modo dado.
+
+        Args:
+            tema_escuro: True para o tema escuro, False para o claro
+
+        Returns:
+            Tema concatenado com ESTILO_GLOBAL_COMPLEMENTO
+        """
+        folha = GerenciadorEstilo._cache_folhas.get(tema_escuro)
+        if folha is None:
+            tema = (
+                GerenciadorEstilo.obter_tema_escuro()
+                if tema_escuro
+                else GerenciadorEstilo.obter_tema_claro()
+            )
+            folha = tema + ESTILO_GLOBAL_COMPLEMENTO
+            GerenciadorEstilo._cache_folhas[tema_escuro] = folha
+        return folha
@@ -13,9 +13,16 @@ from constantes import (
     ATRASO_FADE_IN, DURACAO_FADE_IN, ATRASO_SOMBRA_COLUNA,
     RAIO_DESFOQUE_SOMBRA, DESLOCAMENTO_Y_SOMBRA, COR_SOMBRA,
     DURACAO_TOAST_CURTA, DURACAO_TOAST_MEDIA, FAMILIA_FONTE, TAMANHO_FONTE,
-    NOME_ORGANIZACAO, NOME_APLICACAO
+    NOME_ORGANIZACAO, NOME_APLICACAO,
+    MSG_TAREFA_ADICIONADA, MSG_ERRO_CRIAR_TAREFA, MSG_TEMA_ATIVADO,
+    MSG_SINCRONIZACAO_SUCESSO, MSG_TAREFAS_JA_SINCRONIZADAS,
+    MSG_ERRO_SINCRONIZACAO, MSG_SEM_ATIVIDADES_FIM_SEMANA,
+    MSG_NENHUMA_ATIVIDADE_DIA
+)
+from dominio import (
+    DIAS_DA_SEMANA, StatusTarefa, converter_string_para_dia,
+    obter_dia_semana_atual
 )
-from dominio import DiaDaSemana, StatusTarefa, converter_string_para_dia
 from persistencia import RepositorioTarefas
 from servicos import ServicoTarefas, ServicoHorarios, ServicoSincronizacao
 from estilos import GerenciadorEstilo
@@ -35,6 +42,10 @@ class JanelaPrincipal(QMainWindow):
     
     solicitacao_atualizacao = pyqtSignal()
 
+    # Texto do botão de tema indexado por tema_escuro: o botão oferece o
+    # modo oposto ao ativo
+    _TEXTO_BOTAO_TEMA = ("Modo Escuro", "Modo Claro")
+
     def __init__(self):
         super().__init__()
         self._inicializar_servicos()
@@ -57,6 +68,7 @@ class JanelaPrincipal(QMainWindow):
         """Inicializa configurações da aplicação."""
         self.configuracoes = QSettings(NOME_ORGANIZACAO, NOME_APLICACAO)
         self.tema_escuro = self.configuracoes.value("modo_escuro", False, type=bool)
+        self._folha_aplicada = None
         logger.info(f"Tema carregado: {'Escuro' if self.tema_escuro else 'Claro'}")
 
     def _configurar_janela(self) -> None:
@@ -106,23 +118,31 @@ class JanelaPrincipal(QMainWindow):
         layout_kanban = QHBoxLayout(self.widget_kanban)
         self.colunas = []
         
-        for dia in DiaDaSemana:
+        for dia in DIAS_DA_SEMANA:
             coluna = ColunaDia(dia, self.servico_tarefas)
-            coluna.dados_alterados.connect(self.atualizar_tudo)
+            coluna.dados_alterados.connect(self._agendar_atualizacao)
             layout_kanban.addWidget(coluna)
             self.colunas.append(coluna)
-            
-            QTimer.singleShot(
-                ATRASO_SOMBRA_COLUNA,
-                lambda c=coluna: aplicar_sombra(
-                    c,
-                    raio_desfoque=RAIO_DESFOQUE_SOMBRA,
-                    deslocamento_y=DESLOCAMENTO_Y_SOMBRA,
-                    cor=COR_SOMBRA
-                )
-            )
-        
+
+        # Um único timer aplica as sombras de todas as colunas, em vez de
+        # um singleShot (e um lambda) por coluna
+        QTimer.singleShot(ATRASO_SOMBRA_COLUNA, self._aplicar_sombras_colunas)
+
+        # Bound methods içados uma vez: atualizar_tudo roda a cada mudança
+        # de dados e dispensa o LOAD_ATTR por coluna no loop
+        self._atualizadores_colunas = tuple(coluna.atualizar for coluna in self.colunas)
+
         self.abas.addTab(self.widget_kanban, "Kanban")
+
+    def _aplicar_sombras_colunas(self) -> None:
+        """Aplica a sombra padrão a todas as colunas do Kanban."""
+        for coluna in self.colunas:
+            aplicar_sombra(
+                coluna,
+                raio_desfoque=RAIO_DESFOQUE_SOMBRA,
+                deslocamento_y=DESLOCAMENTO_Y_SOMBRA,
+                cor=COR_SOMBRA
+            )
     
     def _criar_aba_horarios(self) -> None:
         """Cria a aba de visualização de horários."""
@@ -135,7 +155,17 @@ class JanelaPrincipal(QMainWindow):
 
     def _conectar_sinais(self) -> None:
         """Conecta sinais e slots."""
-        self.solicitacao_atualizacao.connect(self.atualizar_tudo)
+        # Coalescedor: uma rajada de emissões no mesmo giro do event loop
+        # (drag-drop + sincronização, por exemplo) vira um refresh só
+        self._timer_atualizacao = QTimer(self)
+        self._timer_atualizacao.setSingleShot(True)
+        self._timer_atualizacao.setInterval(0)
+        self._timer_atualizacao.timeout.connect(self.atualizar_tudo)
+        self.solicitacao_atualizacao.connect(self._agendar_atualizacao)
+
+    def _agendar_atualizacao(self) -> None:
+        """Agenda um atualizar_tudo coalescido para o próximo giro do loop."""
+        self._timer_atualizacao.start()
 
     def _aplicar_animacao_inicial(self) -> None:
         """Aplica animação de fade in inicial."""
@@ -157,50 +187,50 @@ class JanelaPrincipal(QMainWindow):
                     )
                     if id_tarefa:
                         self.atualizar_tudo()
-                        mostrar_toast(self, f"Tarefa '{titulo}' adicionada!", DURACAO_TOAST_MEDIA)
+                        mostrar_toast(self, MSG_TAREFA_ADICIONADA.format(titulo=titulo), DURACAO_TOAST_MEDIA)
                         logger.info(f"Tarefa '{titulo}' criada com ID {id_tarefa}")
                     else:
-                        mostrar_toast(self, "Erro ao criar tarefa", DURACAO_TOAST_CURTA)
+                        mostrar_toast(self, MSG_ERRO_CRIAR_TAREFA, DURACAO_TOAST_CURTA)
                         logger.error("Falha ao criar tarefa")
 
     def atualizar_tudo(self) -> None:
         """Atualiza todas as visualizações."""
-        for coluna in self.colunas:
-            coluna.atualizar()
+        for atualizar in self._atualizadores_colunas:
+            atualizar()
         self.visualizacao_horarios.carregar_dados()
         logger.debug("Interface atualizada")
     
     def _sincronizar_agenda(self) -> None:
         """Sincroniza atividades da agenda para o Kanban."""
-        from dominio import obter_dia_semana_atual
-        
-        def callback_sucesso(resultado: dict):
-            criadas = resultado.get('criadas', 0)
-            ignoradas = resultado.get('ignoradas', 0)
-            erros = resultado.get('erros', [])
-            
-            dia_atual = obter_dia_semana_atual()
-            nome_dia = dia_atual.value if dia_atual else "hoje"
-            
-            if criadas > 0:
-                mostrar_toast(self, f"{criadas} tarefa(s) de {nome_dia} sincronizada(s)!", DURACAO_TOAST_MEDIA)
-                self.atualizar_tudo()
-            elif ignoradas > 0:
-                mostrar_toast(self, f"Tarefas de {nome_dia} já sincronizadas", DURACAO_TOAST_CURTA)
-            elif erros:
-                mostrar_toast(self, f"Erro na sincronização: {erros[0]}", DURACAO_TOAST_MEDIA)
-            elif dia_atual is None:
-                mostrar_toast(self, "Fim de semana - sem atividades", DURACAO_TOAST_CURTA)
-            else:
-                mostrar_toast(self, f"Nenhuma atividade em {nome_dia}", DURACAO_TOAST_CURTA)
-            
-            logger.info(f"Sincronização: {criadas} criadas, {ignoradas} ignoradas")
-        
-        def callback_erro(erro: Exception):
-            mostrar_toast(self, f"Erro: {erro}", DURACAO_TOAST_MEDIA)
-            logger.error(f"Erro na sincronização: {erro}")
-        
-        self.servico_sincronizacao.sincronizar_async(callback_sucesso, callback_erro)
+        self.servico_sincronizacao.sincronizar_async(self._sinc_sucesso, self._sinc_erro)
+
+    def _sinc_sucesso(self, resultado: dict) -> None:
+        """Trata o resultado de uma sincronização bem-sucedida."""
+        criadas = resultado.get('criadas', 0)
+        ignoradas = resultado.get('ignoradas', 0)
+        erros = resultado.get('erros', [])
+
+        dia_atual = obter_dia_semana_atual()
+        nome_dia = dia_atual.value if dia_atual else "hoje"
+
+        if criadas > 0:
+            mostrar_toast(self, MSG_SINCRONIZACAO_SUCESSO.format(quantidade=criadas, dia=nome_dia), DURACAO_TOAST_MEDIA)
+            self.atualizar_tudo()
+        elif ignoradas > 0:
+            mostrar_toast(self, MSG_TAREFAS_JA_SINCRONIZADAS.format(dia=nome_dia), DURACAO_TOAST_CURTA)
+        elif erros:
+            mostrar_toast(self, MSG_ERRO_SINCRONIZACAO.format(erro=erros[0]), DURACAO_TOAST_MEDIA)
+        elif dia_atual is None:
+            mostrar_toast(self, MSG_SEM_ATIVIDADES_FIM_SEMANA, DURACAO_TOAST_CURTA)
+        else:
+            mostrar_toast(self, MSG_NENHUMA_ATIVIDADE_DIA.format(dia=nome_dia), DURACAO_TOAST_CURTA)
+
+        logger.info(f"Sincronização: {criadas} criadas, {ignoradas} ignoradas")
+
+    def _sinc_erro(self, erro: Exception) -> None:
+        """Trata falha na sincronização."""
+        mostrar_toast(self, f"Erro: {erro}", DURACAO_TOAST_MEDIA)
+        logger.error(f"Erro na sincronização: {erro}")
 
     def _alternar_tema(self) -> None:
         """Alterna entre tema claro e escuro."""
@@ -209,22 +239,34 @@ class JanelaPrincipal(QMainWindow):
         self.aplicar_tema()
         
         tema_nome = "Modo Escuro" if self.tema_escuro else "Modo Claro"
-        mostrar_toast(self, f"{tema_nome} ativado", DURACAO_TOAST_CURTA)
+        mostrar_toast(self, MSG_TEMA_ATIVADO.format(tema=tema_nome), DURACAO_TOAST_CURTA)
         logger.info(f"Tema alternado para: {tema_nome}")
 
+    def closeEvent(self, evento) -> None:
+        """Persiste as configurações pendentes ao fechar a janela."""
+        # Um sync() explícito no fechamento: os setValue feitos durante a
+        # sessão (troca de tema) ficam no buffer do Qt até aqui, em vez de
+        # forçar escrita no armazenamento da plataforma a cada toggle
+        self.configuracoes.sync()
+        super().closeEvent(evento)
+
     def aplicar_tema(self) -> None:
         """Aplica o tema atual à aplicação."""
-        aplicacao = QApplication.instance()
-        if self.tema_escuro:
-            aplicacao.setStyleSheet(GerenciadorEstilo.obter_tema_escuro())
-        else:
-            aplicacao.setStyleSheet(GerenciadorEstilo.obter_tema_claro())
-        
+        # Folha única (tema + complemento global por objectName): um parse
+        # de QSS por aplicação, em vez de snippets widget a widget. O cache
+        # em GerenciadorEstilo devolve sempre o MESMO objeto por modo, então
+        # a comparação por identidade evita repolir todos os widgets quando
+        # o tema efetivo não mudou
+        folha = GerenciadorEstilo.obter_folha_aplicacao(self.tema_escuro)
+        if folha is not self._folha_aplicada:
+            QApplication.instance().setStyleSheet(folha)
+            self._folha_aplicada = folha
+
         self.acao_tema.setText(self._obter_texto_botao_tema())
     
     def _obter_texto_botao_tema(self) -> str:
         """Retorna o texto apropriado para o botão de tema."""
-        return "Modo Claro" if self.tema_escuro else "Modo Escuro"
+        return self._TEXTO_BOTAO_TEMA[self.tema_escuro]
 
 
 def main():
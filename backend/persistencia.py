@@ -5,11 +5,11 @@ Atualizado para suportar prioridades, periodicidade e integração Agenda-Kanban
 """
 import sqlite3
 import logging
-from typing import Optional, List, Tuple
+import threading
+from typing import Optional, List, Set, Tuple
 from contextlib import contextmanager
-from datetime import date
 
-from dominio import TarefaDTO, AtividadeAgendaDTO
+from dominio import TarefaDTO, AtividadeAgendaDTO, hoje_iso
 from constantes import HORARIO_INICIO_PADRAO, HORARIO_FIM_PADRAO
 
 logger = logging.getLogger(__name__)
@@ -88,20 +88,55 @@ class ConsultasSQL:
         )
     '''
     
+    # Script único com todo o DDL — uma chamada ao executescript evita o
+    # round-trip Python/SQLite por tabela na inicialização
+    CRIAR_TODAS_TABELAS = ";\n".join([
+        CRIAR_TABELA_TAREFAS,
+        CRIAR_TABELA_DEFINICOES_HORARIO,
+        CRIAR_TABELA_AGENDA,
+        CRIAR_TABELA_ATIVIDADES_AGENDA,
+    ])
+
+    # Índices de cobertura para as consultas quentes (render do Kanban e
+    # gerador de recorrências) — criados após a migração de colunas
+    CRIAR_INDICES = '''
+        CREATE INDEX IF NOT EXISTS idx_tarefas_dia_prio ON tarefas(dia, prioridade);
+        CREATE INDEX IF NOT EXISTS idx_tarefas_origem ON tarefas(atividade_origem_id, data_criacao);
+        CREATE INDEX IF NOT EXISTS idx_ativ_agenda_dia ON atividades_agenda(dia_semana, ativa)
+    '''
+
     # Queries de tarefas - ATUALIZADAS
     INSERIR_TAREFA = """
         INSERT INTO tarefas (titulo, dia, status, horario, prioridade, origem, atividade_origem_id, data_criacao) 
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
     """
-    ATUALIZAR_TAREFA = "UPDATE tarefas SET dia = ?, status = ? WHERE id = ?"
+    # O predicado extra faz do UPDATE um no-op detectável (rowcount 0)
+    # quando a tarefa já está no dia/status de destino
+    ATUALIZAR_TAREFA = (
+        "UPDATE tarefas SET dia = ?, status = ? "
+        "WHERE id = ? AND (dia <> ? OR status <> ?)"
+    )
     DELETAR_TAREFA = "DELETE FROM tarefas WHERE id = ?"
-    SELECIONAR_TAREFAS_POR_DIA = "SELECT * FROM tarefas WHERE dia = ? ORDER BY prioridade ASC"
-    SELECIONAR_TODAS_TAREFAS = "SELECT * FROM tarefas ORDER BY prioridade ASC"
+
+    # Colunas na ordem dos campos do TarefaDTO — permite conversão posicional
+    # sem os probes 'coluna in row.keys()' por linha
+    COLUNAS_TAREFA = "titulo, dia, status, id, horario, prioridade, origem, atividade_origem_id, data_criacao"
+    SELECIONAR_TAREFAS_POR_DIA = f"SELECT {COLUNAS_TAREFA} FROM tarefas WHERE dia = ? ORDER BY prioridade ASC"
+    SELECIONAR_TODAS_TAREFAS = f"SELECT {COLUNAS_TAREFA} FROM tarefas ORDER BY prioridade ASC"
     
+    # Apenas os títulos que contam como duplicata na sincronização do dia
+    # (criados na data informada ou originados da agenda) — projeção mínima,
+    # sem montar TarefaDTO
+    SELECIONAR_TITULOS_DUPLICAVEIS = """
+        SELECT titulo FROM tarefas
+        WHERE dia = ? AND (data_criacao = ? OR origem = 'agenda')
+    """
+
     # Query para verificar duplicatas de tarefas da agenda
+    # (SELECT 1 ... LIMIT 1 para no primeiro resultado, em vez de contar tudo)
     VERIFICAR_TAREFA_AGENDA_EXISTE = """
-        SELECT COUNT(*) FROM tarefas 
-        WHERE atividade_origem_id = ? AND data_criacao = ?
+        SELECT 1 FROM tarefas
+        WHERE atividade_origem_id = ? AND data_criacao = ? LIMIT 1
     """
     
     # Queries de definições de horário
@@ -113,6 +148,12 @@ class ConsultasSQL:
     # Queries de agenda (células)
     INSERIR_OU_SUBSTITUIR_AGENDA = "INSERT OR REPLACE INTO agenda (rotulo_horario, coluna, atividade) VALUES (?, ?, ?)"
     SELECIONAR_TODAS_AGENDAS = "SELECT rotulo_horario, coluna, atividade FROM agenda"
+    # Apenas as células preenchidas de uma coluna (dia) — filtro no SQL em
+    # vez de transferir a grade inteira e filtrar em Python
+    SELECIONAR_AGENDAS_POR_COLUNA = """
+        SELECT rotulo_horario, atividade FROM agenda
+        WHERE coluna = ? AND atividade IS NOT NULL AND TRIM(atividade) <> ''
+    """
     DELETAR_AGENDA_POR_HORARIO = "DELETE FROM agenda WHERE rotulo_horario = ?"
     
     # NOVAS: Queries de atividades da agenda
@@ -127,47 +168,14 @@ class ConsultasSQL:
     """
     ATUALIZAR_ULTIMA_GERACAO = "UPDATE atividades_agenda SET ultima_geracao = ? WHERE id = ?"
     DELETAR_ATIVIDADE_AGENDA = "DELETE FROM atividades_agenda WHERE id = ?"
-    SELECIONAR_ATIVIDADES_POR_DIA = """
-        SELECT * FROM atividades_agenda WHERE dia_semana = ? AND ativa = 1
-    """
-    SELECIONAR_TODAS_ATIVIDADES_AGENDA = "SELECT * FROM atividades_agenda ORDER BY horario ASC"
-    SELECIONAR_ATIVIDADES_ATIVAS = "SELECT * FROM atividades_agenda WHERE ativa = 1"
-
 
-@contextmanager
-def obter_conexao_bd(caminho_bd: str):
+    # Colunas na ordem dos campos do AtividadeAgendaDTO (conversão posicional)
+    COLUNAS_ATIVIDADE = "titulo, dia_semana, horario, prioridade, periodicidade, ativa, id, ultima_geracao"
+    SELECIONAR_ATIVIDADES_POR_DIA = f"""
+        SELECT {COLUNAS_ATIVIDADE} FROM atividades_agenda WHERE dia_semana = ? AND ativa = 1
     """
-    Context manager para conexões com banco de dados.
-    
-    Args:
-        caminho_bd: Caminho para o arquivo do banco de dados
-        
-    Yields:
-        Conexão SQLite configurada
-        
-    Raises:
-        ErroConexaoBancoDados: Se não for possível conectar
-        ErroOperacaoBancoDados: Se ocorrer erro durante operação
-    """
-    conexao = None
-    try:
-        conexao = sqlite3.connect(caminho_bd)
-        conexao.row_factory = sqlite3.Row
-        yield conexao
-        conexao.commit()
-    except sqlite3.OperationalError as erro:
-        logger.error(f"Erro de operação no banco de dados: {erro}")
-        if conexao:
-            conexao.rollback()
-        raise ErroConexaoBancoDados(f"Não foi possível conectar ao banco: {erro}") from erro
-    except sqlite3.Error as erro:
-        logger.error(f"Erro no banco de dados: {erro}")
-        if conexao:
-            conexao.rollback()
-        raise ErroOperacaoBancoDados(f"Erro ao executar operação: {erro}") from erro
-    finally:
-        if conexao:
-            conexao.close()
+    SELECIONAR_TODAS_ATIVIDADES_AGENDA = f"SELECT {COLUNAS_ATIVIDADE} FROM atividades_agenda ORDER BY horario ASC"
+    SELECIONAR_ATIVIDADES_ATIVAS = f"SELECT {COLUNAS_ATIVIDADE} FROM atividades_agenda WHERE ativa = 1"
 
 
 # =============================================================================
@@ -180,17 +188,120 @@ class RepositorioTarefas:
     
     def __init__(self, caminho_bd: str):
         self.caminho_bd = caminho_bd
+        # Profundidade de transações aninhadas por thread: só o nível mais
+        # externo faz commit/rollback, permitindo agrupar várias operações
+        # do repositório em um único fsync via transacao()
+        self._local = threading.local()
+        # A conexão é compartilhada entre a thread principal e os workers
+        # (check_same_thread=False); o RLock serializa as transações entre
+        # threads — sem ele, o commit/rollback de uma thread encerraria a
+        # transação parcial de outra. Reentrante para os níveis aninhados
+        # da mesma thread.
+        self._trava_transacao = threading.RLock()
+        self._conexao = self._abrir_conexao()
         self._inicializar_tabelas()
         self._migrar_banco_se_necessario()
+        self._criar_indices()
+
+    def _abrir_conexao(self) -> sqlite3.Connection:
+        """Abre a conexão compartilhada do repositório.
+
+        Uma única conexão de vida longa evita pagar connect + warmup do
+        page cache a cada operação. check_same_thread=False permite uso
+        pelos workers do pool de threads; as transações entre threads são
+        serializadas por _trava_transacao em _transacao().
+
+        Returns:
+            Conexão SQLite configurada
+
+        Raises:
+            ErroConexaoBancoDados: Se não for possível conectar
+        """
+        try:
+            conexao = sqlite3.connect(self.caminho_bd, check_same_thread=False)
+            conexao.row_factory = sqlite3.Row
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            conexao.execute("PRAGMA temp_store=MEMORY")
+            conexao.execute("PRAGMA cache_size=-8000")
+            return conexao
+        except sqlite3.Error as erro:
+            logger.error(f"Erro ao abrir o banco de dados: {erro}")
+            raise ErroConexaoBancoDados(f"Não foi possível conectar ao banco: {erro}") from erro
+
+    @contextmanager
+    def _transacao(self):
+        """
+        Context manager de transação sobre a conexão compartilhada.
+
+        Reentrante: quando aninhado dentro de transacao(), os níveis
+        internos apenas delegam o commit/rollback ao nível mais externo,
+        de modo que todas as operações compartilham um único fsync.
+
+        O nível mais externo segura _trava_transacao do início ao fim:
+        transações disparadas de threads diferentes (UI vs. workers do
+        pool) nunca se entrelaçam na conexão compartilhada.
+
+        Yields:
+            Conexão SQLite compartilhada
+
+        Raises:
+            ErroConexaoBancoDados: Se ocorrer erro operacional
+            ErroOperacaoBancoDados: Se ocorrer erro durante a operação
+        """
+        profundidade = getattr(self._local, 'profundidade', 0)
+        if profundidade == 0:
+            self._trava_transacao.acquire()
+        self._local.profundidade = profundidade + 1
+        try:
+            yield self._conexao
+            if profundidade == 0:
+                self._conexao.commit()
+        except ErroRepositorio:
+            if profundidade == 0:
+                self._conexao.rollback()
+            raise
+        except sqlite3.OperationalError as erro:
+            logger.error(f"Erro de operação no banco de dados: {erro}")
+            if profundidade == 0:
+                self._conexao.rollback()
+            raise ErroConexaoBancoDados(f"Não foi possível conectar ao banco: {erro}") from erro
+        except sqlite3.Error as erro:
+            logger.error(f"Erro no banco de dados: {erro}")
+            if profundidade == 0:
+                self._conexao.rollback()
+            raise ErroOperacaoBancoDados(f"Erro ao executar operação: {erro}") from erro
+        except Exception:
+            if profundidade == 0:
+                self._conexao.rollback()
+            raise
+        finally:
+            self._local.profundidade = profundidade
+            if profundidade == 0:
+                self._trava_transacao.release()
+
+    def transacao(self):
+        """
+        Agrupa várias chamadas ao repositório em uma única transação.
+
+        Dentro do bloco, os métodos do repositório deixam de fazer commit
+        individual: tudo é confirmado (ou desfeito) de uma só vez na saída,
+        amortizando o custo de fsync em lotes de gravações.
+
+        Returns:
+            Context manager da transação compartilhada
+        """
+        return self._transacao()
+
+    def fechar(self) -> None:
+        """Fecha a conexão compartilhada com o banco."""
+        self._conexao.close()
 
     def _inicializar_tabelas(self) -> None:
         """Inicializa as tabelas do banco de dados."""
         try:
-            with obter_conexao_bd(self.caminho_bd) as conexao:
-                conexao.execute(ConsultasSQL.CRIAR_TABELA_TAREFAS)
-                conexao.execute(ConsultasSQL.CRIAR_TABELA_DEFINICOES_HORARIO)
-                conexao.execute(ConsultasSQL.CRIAR_TABELA_AGENDA)
-                conexao.execute(ConsultasSQL.CRIAR_TABELA_ATIVIDADES_AGENDA)
+            with self._transacao() as conexao:
+                conexao.executescript(ConsultasSQL.CRIAR_TODAS_TABELAS)
                 self._popular_horarios_padrao(conexao)
             logger.info("Tabelas inicializadas com sucesso")
         except Exception as e:
@@ -200,7 +311,7 @@ class RepositorioTarefas:
     def _migrar_banco_se_necessario(self) -> None:
         """Adiciona novas colunas se não existirem (migração)."""
         try:
-            with obter_conexao_bd(self.caminho_bd) as conexao:
+            with self._transacao() as conexao:
                 # Verificar e adicionar colunas novas na tabela tarefas
                 cursor = conexao.execute("PRAGMA table_info(tarefas)")
                 colunas_existentes = {row['name'] for row in cursor.fetchall()}
@@ -219,7 +330,15 @@ class RepositorioTarefas:
                         
         except Exception as e:
             logger.error(f"Erro na migração do banco: {e}")
-    
+
+    def _criar_indices(self) -> None:
+        """Cria os índices das consultas quentes (após a migração de colunas)."""
+        try:
+            with self._transacao() as conexao:
+                conexao.executescript(ConsultasSQL.CRIAR_INDICES)
+        except Exception as e:
+            logger.error(f"Erro ao criar índices: {e}")
+
     def _popular_horarios_padrao(self, conexao: sqlite3.Connection) -> None:
         """Popula horários padrão se a tabela estiver vazia."""
         cursor = conexao.execute(ConsultasSQL.CONTAR_DEFINICOES_HORARIO)
@@ -232,30 +351,38 @@ class RepositorioTarefas:
             logger.info(f"Populados {len(horarios_padrao)} horários padrão")
     
     def _converter_row_para_dto(self, row: sqlite3.Row) -> TarefaDTO:
-        """Converte uma row do banco para TarefaDTO."""
+        """Converte uma row do banco para TarefaDTO.
+
+        A row vem na ordem de ConsultasSQL.COLUNAS_TAREFA, alinhada aos
+        campos do DTO — acesso posicional, sem lookup por nome.
+        """
         return TarefaDTO(
-            id=row['id'],
-            titulo=row['titulo'],
-            dia=row['dia'],
-            status=row['status'],
-            horario=row['horario'] or "",
-            prioridade=row['prioridade'] if 'prioridade' in row.keys() else 3,
-            origem=row['origem'] if 'origem' in row.keys() else "manual",
-            atividade_origem_id=row['atividade_origem_id'] if 'atividade_origem_id' in row.keys() else None,
-            data_criacao=row['data_criacao'] if 'data_criacao' in row.keys() else None
+            row[0],                                 # titulo
+            row[1],                                 # dia
+            row[2],                                 # status
+            row[3],                                 # id
+            row[4] or "",                           # horario
+            3 if row[5] is None else row[5],        # prioridade
+            row[6] or "manual",                     # origem
+            row[7],                                 # atividade_origem_id
+            row[8],                                 # data_criacao
         )
-    
+
     def _converter_row_para_atividade_dto(self, row: sqlite3.Row) -> AtividadeAgendaDTO:
-        """Converte uma row do banco para AtividadeAgendaDTO."""
+        """Converte uma row do banco para AtividadeAgendaDTO.
+
+        A row vem na ordem de ConsultasSQL.COLUNAS_ATIVIDADE, alinhada aos
+        campos do DTO.
+        """
         return AtividadeAgendaDTO(
-            id=row['id'],
-            titulo=row['titulo'],
-            dia_semana=row['dia_semana'],
-            horario=row['horario'],
-            prioridade=row['prioridade'],
-            periodicidade=row['periodicidade'],
-            ativa=bool(row['ativa']),
-            ultima_geracao=row['ultima_geracao']
+            row[0],                                 # titulo
+            row[1],                                 # dia_semana
+            row[2],                                 # horario
+            row[3],                                 # prioridade
+            row[4],                                 # periodicidade
+            bool(row[5]),                           # ativa
+            row[6],                                 # id
+            row[7],                                 # ultima_geracao
         )
 
     # =========================================================================
@@ -272,29 +399,62 @@ class RepositorioTarefas:
         Returns:
             ID da tarefa criada
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(
                 ConsultasSQL.INSERIR_TAREFA,
                 (tarefa.titulo, tarefa.dia, tarefa.status, tarefa.horario,
                  tarefa.prioridade, tarefa.origem, tarefa.atividade_origem_id,
-                 tarefa.data_criacao or date.today().isoformat())
+                 tarefa.data_criacao or hoje_iso())
             )
             return cursor.lastrowid
 
-    def atualizar_status(self, id_tarefa: int, novo_dia: str, novo_status: str) -> None:
+    def adicionar_lote(self, tarefas: List[TarefaDTO]) -> List[int]:
+        """
+        Adiciona várias tarefas em uma única transação.
+
+        A geração de recorrências materializa N tarefas de uma vez; um
+        único commit reduz o custo de fsync de N para 1. Os inserts são
+        executados um a um dentro da transação para recuperar o lastrowid
+        de cada tarefa (executemany não expõe os ids gerados).
+
+        Args:
+            tarefas: DTOs das tarefas a adicionar
+
+        Returns:
+            IDs das tarefas criadas, na mesma ordem da entrada
+        """
+        if not tarefas:
+            return []
+        ids: List[int] = []
+        with self._transacao() as conexao:
+            for tarefa in tarefas:
+                cursor = conexao.execute(
+                    ConsultasSQL.INSERIR_TAREFA,
+                    (tarefa.titulo, tarefa.dia, tarefa.status, tarefa.horario,
+                     tarefa.prioridade, tarefa.origem, tarefa.atividade_origem_id,
+                     tarefa.data_criacao or hoje_iso())
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def atualizar_status(self, id_tarefa: int, novo_dia: str, novo_status: str) -> bool:
         """
         Atualiza dia e status de uma tarefa.
-        
+
         Args:
             id_tarefa: ID da tarefa
             novo_dia: Novo dia da semana
             novo_status: Novo status da tarefa
+
+        Returns:
+            True se a tarefa realmente mudou de dia/status
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
-            conexao.execute(
-                ConsultasSQL.ATUALIZAR_TAREFA, 
-                (novo_dia, novo_status, id_tarefa)
+        with self._transacao() as conexao:
+            cursor = conexao.execute(
+                ConsultasSQL.ATUALIZAR_TAREFA,
+                (novo_dia, novo_status, id_tarefa, novo_dia, novo_status)
             )
+            return cursor.rowcount > 0
 
     def deletar(self, id_tarefa: int) -> None:
         """
@@ -303,7 +463,7 @@ class RepositorioTarefas:
         Args:
             id_tarefa: ID da tarefa a deletar
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             conexao.execute(ConsultasSQL.DELETAR_TAREFA, (id_tarefa,))
 
     def obter_por_dia(self, dia: str) -> List[TarefaDTO]:
@@ -316,10 +476,26 @@ class RepositorioTarefas:
         Returns:
             Lista de tarefas do dia
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(ConsultasSQL.SELECIONAR_TAREFAS_POR_DIA, (dia,))
-            return [self._converter_row_para_dto(row) for row in cursor.fetchall()]
+            return list(map(self._converter_row_para_dto, cursor.fetchall()))
     
+    def obter_titulos_por_dia_e_data(self, dia: str, data: str) -> Set[str]:
+        """
+        Obtém só os títulos do dia que contam como duplicata de
+        sincronização: criados na data informada ou com origem na agenda.
+
+        Args:
+            dia: Nome do dia da semana
+            data: Data no formato ISO
+
+        Returns:
+            Conjunto de títulos
+        """
+        with self._transacao() as conexao:
+            cursor = conexao.execute(ConsultasSQL.SELECIONAR_TITULOS_DUPLICAVEIS, (dia, data))
+            return {row[0] for row in cursor.fetchall()}
+
     def verificar_tarefa_agenda_existe(self, atividade_id: int, data: str) -> bool:
         """
         Verifica se uma tarefa da agenda já foi criada para a data especificada.
@@ -331,12 +507,12 @@ class RepositorioTarefas:
         Returns:
             True se já existe, False caso contrário
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(
                 ConsultasSQL.VERIFICAR_TAREFA_AGENDA_EXISTE,
                 (atividade_id, data)
             )
-            return cursor.fetchone()[0] > 0
+            return cursor.fetchone() is not None
 
     # =========================================================================
     # MÉTODOS DE HORÁRIOS (GRADE HORÁRIA)
@@ -349,7 +525,7 @@ class RepositorioTarefas:
         Returns:
             Lista de strings de horários
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(ConsultasSQL.SELECIONAR_DEFINICOES_HORARIO)
             return [row['rotulo_horario'] for row in cursor.fetchall()]
 
@@ -360,7 +536,7 @@ class RepositorioTarefas:
         Args:
             novo_horario: String do horário (formato HH:MM)
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             conexao.execute(ConsultasSQL.INSERIR_DEFINICAO_HORARIO, (novo_horario,))
 
     def remover_horario_definido(self, horario: str) -> None:
@@ -370,7 +546,7 @@ class RepositorioTarefas:
         Args:
             horario: String do horário a remover
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             conexao.execute(ConsultasSQL.DELETAR_DEFINICAO_HORARIO, (horario,))
             conexao.execute(ConsultasSQL.DELETAR_AGENDA_POR_HORARIO, (horario,))
 
@@ -383,25 +559,45 @@ class RepositorioTarefas:
             coluna: Índice da coluna (dia)
             atividade: Texto da atividade
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             conexao.execute(
                 ConsultasSQL.INSERIR_OU_SUBSTITUIR_AGENDA,
                 (rotulo_horario, coluna, atividade)
             )
 
-    def carregar_dados_horarios(self) -> List[Tuple[str, int, str]]:
+    def iter_dados_horarios(self):
         """
-        Carrega todos os dados da agenda.
-        
-        Returns:
-            Lista de tuplas (horario, coluna, atividade)
+        Itera sobre os dados da agenda sem materializar a lista completa.
+
+        Lê o cursor em lotes de fetchmany, permitindo que o consumidor
+        construa sua estrutura final (ex.: o dicionário da grade) em uma
+        única passada, sem a lista intermediária.
+
+        Yields:
+            Tuplas (horario, coluna, atividade)
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(ConsultasSQL.SELECIONAR_TODAS_AGENDAS)
-            return [
-                (row['rotulo_horario'], row['coluna'], row['atividade']) 
-                for row in cursor.fetchall()
-            ]
+            while True:
+                lote = cursor.fetchmany(1000)
+                if not lote:
+                    break
+                for row in lote:
+                    yield (row['rotulo_horario'], row['coluna'], row['atividade'])
+
+    def carregar_dados_horarios_por_coluna(self, coluna: int) -> List[Tuple[str, str]]:
+        """
+        Carrega apenas as células preenchidas de uma coluna (dia) da agenda.
+
+        Args:
+            coluna: Índice da coluna (dia)
+
+        Returns:
+            Lista de tuplas (horario, atividade)
+        """
+        with self._transacao() as conexao:
+            cursor = conexao.execute(ConsultasSQL.SELECIONAR_AGENDAS_POR_COLUNA, (coluna,))
+            return [(row[0], row[1]) for row in cursor.fetchall()]
 
     # =========================================================================
     # MÉTODOS DE ATIVIDADES DA AGENDA (TEMPLATES RECORRENTES)
@@ -417,7 +613,7 @@ class RepositorioTarefas:
         Returns:
             ID da atividade criada
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(
                 ConsultasSQL.INSERIR_ATIVIDADE_AGENDA,
                 (atividade.titulo, atividade.dia_semana, atividade.horario,
@@ -433,7 +629,7 @@ class RepositorioTarefas:
         Args:
             atividade: DTO da atividade com dados atualizados
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             conexao.execute(
                 ConsultasSQL.ATUALIZAR_ATIVIDADE_AGENDA,
                 (atividade.titulo, atividade.dia_semana, atividade.horario,
@@ -449,7 +645,7 @@ class RepositorioTarefas:
             atividade_id: ID da atividade
             data: Data no formato ISO
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             conexao.execute(
                 ConsultasSQL.ATUALIZAR_ULTIMA_GERACAO,
                 (data, atividade_id)
@@ -462,7 +658,7 @@ class RepositorioTarefas:
         Args:
             atividade_id: ID da atividade a deletar
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             conexao.execute(ConsultasSQL.DELETAR_ATIVIDADE_AGENDA, (atividade_id,))
     
     def obter_atividades_por_dia(self, dia_semana: str) -> List[AtividadeAgendaDTO]:
@@ -475,12 +671,12 @@ class RepositorioTarefas:
         Returns:
             Lista de atividades do dia
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(
                 ConsultasSQL.SELECIONAR_ATIVIDADES_POR_DIA,
                 (dia_semana,)
             )
-            return [self._converter_row_para_atividade_dto(row) for row in cursor.fetchall()]
+            return list(map(self._converter_row_para_atividade_dto, cursor.fetchall()))
     
     def obter_todas_atividades_agenda(self) -> List[AtividadeAgendaDTO]:
         """
@@ -489,9 +685,9 @@ class RepositorioTarefas:
         Returns:
             Lista de todas as atividades
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(ConsultasSQL.SELECIONAR_TODAS_ATIVIDADES_AGENDA)
-            return [self._converter_row_para_atividade_dto(row) for row in cursor.fetchall()]
+            return list(map(self._converter_row_para_atividade_dto, cursor.fetchall()))
     
     def obter_atividades_ativas(self) -> List[AtividadeAgendaDTO]:
         """
@@ -500,6 +696,6 @@ class RepositorioTarefas:
         Returns:
             Lista de atividades ativas
         """
-        with obter_conexao_bd(self.caminho_bd) as conexao:
+        with self._transacao() as conexao:
             cursor = conexao.execute(ConsultasSQL.SELECIONAR_ATIVIDADES_ATIVAS)
-            return [self._converter_row_para_atividade_dto(row) for row in cursor.fetchall()]
+            return list(map(self._converter_row_para_atividade_dto, cursor.fetchall()))
@@ -4,19 +4,27 @@ Suporta execução síncrona e assíncrona.
 Atualizado com ServicoSincronizacao para integração Agenda-Kanban.
 """
 import logging
-from typing import List, Optional, Callable, Any
+import threading
+from itertools import count
+from typing import List, Optional, Callable, Any, Sequence, Tuple
 from datetime import datetime, date
 
 from dominio import (
     TarefaDTO, AtividadeAgendaDTO, DiaDaSemana, StatusTarefa,
-    Prioridade, Periodicidade, obter_dia_semana_atual, ExtratorMetadados
+    Prioridade, Periodicidade, obter_dia_semana_atual, ExtratorMetadados,
+    hoje_iso
 )
 from persistencia import RepositorioTarefas, ErroRepositorio
+from workers import executar_async
 from constantes import FORMATO_HORA
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Índice da coluna da grade por dia da semana (0=Segunda ... 4=Sexta),
+# derivado da ordem de declaração do enum
+_INDICE_DIA = {dia: indice for indice, dia in enumerate(DiaDaSemana)}
+
 
 # =============================================================================
 # EXCEÇÕES ESPECÍFICAS DE SERVIÇO
@@ -51,7 +59,22 @@ class ServicoTarefas:
             repositorio: Instância do repositório de dados
         """
         self.repositorio = repositorio
-    
+        # Versão monotônica dos dados: incrementada em cada mutação bem
+        # sucedida, permite que as colunas do Kanban pulem recargas quando
+        # nada mudou desde o último refresh. itertools.count avança em C,
+        # então mutações da UI e do worker de sincronização nunca perdem
+        # um incremento (o += em dois passos perderia)
+        self._contador_versao = count(1)
+        self._versao_dados = 0
+
+    def versao_dados(self) -> int:
+        """Retorna a versão atual dos dados (muda a cada mutação)."""
+        return self._versao_dados
+
+    def _marcar_dados_alterados(self) -> None:
+        """Avança a versão dos dados de forma segura entre threads."""
+        self._versao_dados = next(self._contador_versao)
+
     def criar_tarefa(
         self, 
         titulo: str, 
@@ -59,11 +82,12 @@ class ServicoTarefas:
         status: StatusTarefa = StatusTarefa.FAZER,
         prioridade: int = 3,
         origem: str = "manual",
-        atividade_origem_id: Optional[int] = None
+        atividade_origem_id: Optional[int] = None,
+        data_criacao: Optional[str] = None
     ) -> Optional[int]:
         """
         Cria uma nova tarefa.
-        
+
         Args:
             titulo: Título da tarefa
             dia: Dia da semana (Enum)
@@ -71,7 +95,9 @@ class ServicoTarefas:
             prioridade: Prioridade (0-3, menor = mais urgente)
             origem: "manual" ou "agenda"
             atividade_origem_id: ID da atividade de origem (se origem="agenda")
-            
+            data_criacao: Data ISO a registrar (padrão: hoje) — permite que
+                laços de sincronização passem a data resolvida uma única vez
+
         Returns:
             ID da tarefa criada ou None em caso de erro
             
@@ -79,31 +105,56 @@ class ServicoTarefas:
             ErroValidacao: Se o título for inválido
         """
         try:
-            if not titulo or not titulo.strip():
+            titulo_limpo = titulo.strip() if titulo else ""
+            if not titulo_limpo:
                 logger.warning("[ServicoTarefas] Tentativa de criar tarefa sem título")
                 return None
-            
+
             dto = TarefaDTO(
                 id=None,
-                titulo=titulo.strip(),
+                titulo=titulo_limpo,
                 dia=dia.value,
                 status=status.value,
                 prioridade=prioridade,
                 origem=origem,
                 atividade_origem_id=atividade_origem_id,
-                data_criacao=date.today().isoformat()
+                data_criacao=data_criacao or hoje_iso()
             )
             
             id_tarefa = self.repositorio.adicionar(dto)
-            logger.info(f"[ServicoTarefas] Tarefa '{titulo}' criada com ID {id_tarefa} (P{prioridade})")
+            self._marcar_dados_alterados()
+            logger.info("[ServicoTarefas] Tarefa '%s' criada com ID %s (P%s)", titulo, id_tarefa, prioridade)
             return id_tarefa
-            
+
         except ErroRepositorio as erro:
             logger.error(f"[ServicoTarefas] Erro de repositório ao criar tarefa: {erro}")
             return None
         except Exception as erro:
             logger.error(f"[ServicoTarefas] Erro inesperado ao criar tarefa: {erro}")
             return None
+
+    def criar_tarefas_em_lote(self, tarefas: List[TarefaDTO]) -> List[int]:
+        """
+        Cria várias tarefas em uma única transação do repositório.
+
+        Args:
+            tarefas: DTOs já validados das tarefas a criar
+
+        Returns:
+            IDs das tarefas criadas (lista vazia em caso de erro)
+        """
+        try:
+            ids = self.repositorio.adicionar_lote(tarefas)
+            if ids:
+                self._marcar_dados_alterados()
+            logger.info("[ServicoTarefas] %s tarefas criadas em lote", len(ids))
+            return ids
+        except ErroRepositorio as erro:
+            logger.error(f"[ServicoTarefas] Erro de repositório ao criar lote: {erro}")
+            return []
+        except Exception as erro:
+            logger.error(f"[ServicoTarefas] Erro inesperado ao criar lote: {erro}")
+            return []
     
     def mover_tarefa(
         self, 
@@ -120,17 +171,19 @@ class ServicoTarefas:
             novo_status: Novo status (Enum)
             
         Returns:
-            True se sucesso, False caso contrário
+            True se a tarefa realmente mudou de dia/status, False em no-op ou erro
         """
         try:
-            self.repositorio.atualizar_status(
-                id_tarefa, 
-                novo_dia.value, 
+            mudou = self.repositorio.atualizar_status(
+                id_tarefa,
+                novo_dia.value,
                 novo_status.value
             )
-            logger.info(f"[ServicoTarefas] Tarefa {id_tarefa} movida para {novo_dia.value}/{novo_status.value}")
-            return True
-            
+            if mudou:
+                self._marcar_dados_alterados()
+                logger.info("[ServicoTarefas] Tarefa %s movida para %s/%s", id_tarefa, novo_dia.value, novo_status.value)
+            return mudou
+
         except ErroRepositorio as erro:
             logger.error(f"[ServicoTarefas] Erro de repositório ao mover tarefa {id_tarefa}: {erro}")
             return False
@@ -150,7 +203,8 @@ class ServicoTarefas:
         """
         try:
             self.repositorio.deletar(id_tarefa)
-            logger.info(f"Tarefa {id_tarefa} deletada")
+            self._marcar_dados_alterados()
+            logger.info("Tarefa %s deletada", id_tarefa)
             return True
             
         except Exception as e:
@@ -173,77 +227,62 @@ class ServicoTarefas:
             logger.error(f"Erro ao obter tarefas do dia {dia.value}: {e}")
             return []
     
-    def obter_tarefas_do_dia_async(
-        self, 
-        dia: DiaDaSemana,
-        callback_sucesso: Optional[Callable[[List[TarefaDTO]], None]] = None,
-        callback_erro: Optional[Callable[[Exception], None]] = None
-    ) -> None:
-        """
-        Versão assíncrona de obter_tarefas_do_dia.
-        
-        Args:
-            dia: Dia da semana (Enum)
-            callback_sucesso: Função chamada com a lista de tarefas
-            callback_erro: Função chamada em caso de erro
-        """
-        from workers import executar_async
-        executar_async(
-            self.obter_tarefas_do_dia,
-            callback_sucesso,
-            callback_erro,
-            dia
-        )
-
 
 class ServicoHorarios:
     """Serviço para gerenciar horários e agenda."""
-    
+
     def __init__(self, repositorio: RepositorioTarefas):
         self.repositorio = repositorio
-    
+        # Horários mudam raramente; cache invalidado em adicionar/remover.
+        # Lock porque o serviço também é chamado pelos workers do pool.
+        self._cache_horarios: Optional[List[str]] = None
+        # Dados crus da grade, invalidados em qualquer gravação de célula
+        # ou mudança de horário — navegação entre semanas reusa a leitura
+        self._cache_grade: Optional[dict] = None
+        self._trava_cache = threading.Lock()
+
     def obter_horarios_ordenados(self) -> List[str]:
         """
         Obtém lista de horários ordenados cronologicamente.
-        
+
         Returns:
             Lista de strings de horários ordenados
         """
         try:
-            horarios = self.repositorio.obter_horarios_definidos()
-            return sorted(horarios, key=self._chave_ordenacao_horario)
+            with self._trava_cache:
+                if self._cache_horarios is None:
+                    horarios = self.repositorio.obter_horarios_definidos()
+                    self._cache_horarios = sorted(horarios, key=self._chave_ordenacao_horario)
+                return list(self._cache_horarios)
         except Exception as e:
             logger.error(f"Erro ao obter horários: {e}")
             return []
-    
-    def obter_horarios_ordenados_async(
-        self,
-        callback_sucesso: Optional[Callable[[List[str]], None]] = None,
-        callback_erro: Optional[Callable[[Exception], None]] = None
-    ) -> None:
-        """
-        Versão assíncrona de obter_horarios_ordenados.
-        
-        Args:
-            callback_sucesso: Função chamada com a lista de horários
-            callback_erro: Função chamada em caso de erro
-        """
-        from workers import executar_async
-        executar_async(
-            self.obter_horarios_ordenados,
-            callback_sucesso,
-            callback_erro
-        )
+
+    def _invalidar_cache_horarios(self) -> None:
+        """Descarta os caches após mudança na lista de horários."""
+        with self._trava_cache:
+            self._cache_horarios = None
+            # Remover/renomear horário também muda as células da grade
+            self._cache_grade = None
+
+    def _invalidar_cache_grade(self) -> None:
+        """Descarta o cache da grade após gravação de célula."""
+        with self._trava_cache:
+            self._cache_grade = None
     
     @staticmethod
-    def _chave_ordenacao_horario(horario_str: str) -> datetime:
-        """Função auxiliar para ordenação segura de horários."""
+    def _chave_ordenacao_horario(horario_str: str) -> int:
+        """Função auxiliar para ordenação segura de horários.
+
+        Converte HH:MM para minutos inteiros — bem mais barato do que
+        construir um datetime via strptime só para comparar.
+        """
         try:
-            parte_hora = horario_str.split(' ')[0].strip()
-            return datetime.strptime(parte_hora, FORMATO_HORA)
+            horas, minutos = horario_str.split(' ', 1)[0].strip().split(':')
+            return int(horas) * 60 + int(minutos)
         except ValueError:
             logger.warning(f"Horário inválido para ordenação: {horario_str}")
-            return datetime.max
+            return 10 ** 9
     
     def adicionar_horario(self, horario: str) -> bool:
         """
@@ -261,7 +300,8 @@ class ServicoHorarios:
                 return False
             
             self.repositorio.adicionar_horario_definido(horario)
-            logger.info(f"Horário {horario} adicionado")
+            self._invalidar_cache_horarios()
+            logger.info("Horário %s adicionado", horario)
             return True
             
         except Exception as e:
@@ -280,7 +320,8 @@ class ServicoHorarios:
         """
         try:
             self.repositorio.remover_horario_definido(horario)
-            logger.info(f"Horário {horario} removido")
+            self._invalidar_cache_horarios()
+            logger.info("Horário %s removido", horario)
             return True
             
         except Exception as e:
@@ -301,11 +342,88 @@ class ServicoHorarios:
         """
         try:
             self.repositorio.salvar_celula_horario(horario, dia_indice, atividade)
+            self._invalidar_cache_grade()
             return True
-            
+
         except Exception as e:
             logger.error(f"Erro ao salvar atividade: {e}")
             return False
+
+    def mover_atividade(
+        self,
+        horario_origem: str,
+        coluna_origem: int,
+        horario_destino: str,
+        coluna_destino: int,
+        atividade: str
+    ) -> bool:
+        """
+        Grava uma atividade no destino, limpando a origem se a posição
+        mudou e criando o horário de destino se ainda não existir — tudo
+        numa única transação, com um único fsync e sem estado parcial
+        caso alguma etapa falhe.
+
+        Args:
+            horario_origem: Horário da célula original
+            coluna_origem: Índice do dia da célula original (0-4)
+            horario_destino: Horário da célula de destino
+            coluna_destino: Índice do dia da célula de destino (0-4)
+            atividade: Texto completo da atividade (com metadados)
+
+        Returns:
+            True se sucesso, False caso contrário
+        """
+        try:
+            with self.repositorio.transacao():
+                if (horario_destino, coluna_destino) != (horario_origem, coluna_origem):
+                    self.repositorio.salvar_celula_horario(horario_origem, coluna_origem, "")
+                    # INSERT OR IGNORE: cria o horário se faltar, sem
+                    # consultar o cache — obter_horarios_ordenados aqui
+                    # tomaria _trava_cache já segurando a trava de
+                    # transação, na ordem inversa à dos workers (cache ->
+                    # repositório), com risco de deadlock
+                    self.repositorio.adicionar_horario_definido(horario_destino)
+
+                self.repositorio.salvar_celula_horario(horario_destino, coluna_destino, atividade)
+
+            # Pode ter criado horário novo; derruba também o cache da grade
+            self._invalidar_cache_horarios()
+            return True
+
+        except Exception as e:
+            logger.error(f"Erro ao mover atividade: {e}")
+            return False
+
+    def substituir_horario(self, horario_antigo: str, horario_novo: str) -> bool:
+        """
+        Troca um horário por outro numa única transação.
+
+        Substitui o par remover + adicionar da UI, que podia deixar a
+        grade sem o horário antigo se a segunda etapa falhasse.
+
+        Args:
+            horario_antigo: Horário a remover
+            horario_novo: Horário que o substitui (formato HH:MM)
+
+        Returns:
+            True se sucesso, False caso contrário
+        """
+        try:
+            if not self._validar_formato_horario(horario_novo):
+                logger.warning(f"Formato de horário inválido: {horario_novo}")
+                return False
+
+            with self.repositorio.transacao():
+                self.repositorio.remover_horario_definido(horario_antigo)
+                self.repositorio.adicionar_horario_definido(horario_novo)
+
+            self._invalidar_cache_horarios()
+            logger.info("Horário %s substituído por %s", horario_antigo, horario_novo)
+            return True
+
+        except Exception as e:
+            logger.error(f"Erro ao substituir horário {horario_antigo}: {e}")
+            return False
     
     def obter_dados_grade(self) -> dict:
         """
@@ -315,31 +433,87 @@ class ServicoHorarios:
             Dicionário com chave (horario, dia_indice) -> atividade
         """
         try:
-            dados = self.repositorio.carregar_dados_horarios()
-            return {(d[0], d[1]): d[2] for d in dados}
+            with self._trava_cache:
+                if self._cache_grade is None:
+                    # Uma passada só: o iterador do repositório alimenta o
+                    # dict diretamente, sem materializar lista intermediária
+                    self._cache_grade = {
+                        (horario, coluna): atividade
+                        for horario, coluna, atividade in self.repositorio.iter_dados_horarios()
+                    }
+                # Cópia rasa: quem chama pode mutar o resultado à vontade
+                return dict(self._cache_grade)
         except Exception as e:
             logger.error(f"Erro ao carregar dados da grade: {e}")
             return {}
     
-    def obter_dados_grade_async(
+    def obter_grade_expandida(self, datas_semana: Sequence[date]) -> dict:
+        """
+        Obtém os dados da grade com as atividades diárias já replicadas
+        nas colunas da semana informada.
+
+        A expansão (parsing de metadados e replicação a partir da data de
+        criação) morava na UI e rodava na thread principal; aqui ela roda
+        no mesmo worker que lê os dados, sobre o cache da grade.
+
+        Args:
+            datas_semana: Datas de segunda a sexta da semana exibida
+
+        Returns:
+            Dicionário (horario, dia_indice) -> atividade, já expandido
+        """
+        dados = self.obter_dados_grade()
+        hoje = date.today()
+
+        for (horario, coluna), texto in list(dados.items()):
+            if not texto:
+                continue
+            metadados = ExtratorMetadados.extrair_metadados(texto)
+            if metadados.periodicidade != "diaria":
+                continue
+            data_criacao = metadados.data_criacao or hoje
+            for indice, data_dia in enumerate(datas_semana):
+                if data_dia >= data_criacao and not dados.get((horario, indice)):
+                    dados[(horario, indice)] = texto
+
+        return dados
+
+    def obter_grade_completa(self, datas_semana: Sequence[date]) -> Tuple[List[str], dict]:
+        """
+        Obtém horários ordenados e grade expandida de uma vez.
+
+        Args:
+            datas_semana: Datas de segunda a sexta da semana exibida
+
+        Returns:
+            Tupla (horarios_ordenados, dados_expandidos)
+        """
+        return self.obter_horarios_ordenados(), self.obter_grade_expandida(datas_semana)
+
+    def obter_grade_completa_async(
         self,
-        callback_sucesso: Optional[Callable[[dict], None]] = None,
+        datas_semana: Sequence[date],
+        callback_sucesso: Optional[Callable[[Tuple[List[str], dict]], None]] = None,
         callback_erro: Optional[Callable[[Exception], None]] = None
     ) -> None:
         """
-        Versão assíncrona de obter_dados_grade.
-        
+        Versão assíncrona de obter_grade_completa: uma única viagem de
+        worker e um único callback na thread principal, em vez do
+        encadeamento horários -> grade com duas passagens pelo event loop.
+
         Args:
-            callback_sucesso: Função chamada com o dicionário de dados
+            datas_semana: Datas de segunda a sexta da semana exibida
+            callback_sucesso: Função chamada com (horarios, dados)
             callback_erro: Função chamada em caso de erro
         """
-        from workers import executar_async
         executar_async(
-            self.obter_dados_grade,
+            self.obter_grade_completa,
             callback_sucesso,
-            callback_erro
+            callback_erro,
+            tuple(datas_semana),
+            tipo="cpu"
         )
-    
+
     @staticmethod
     def _validar_formato_horario(horario: str) -> bool:
         """Valida se o horário está no formato HH:MM."""
@@ -378,13 +552,14 @@ class ServicoAgenda:
             ID da atividade criada ou None em caso de erro
         """
         try:
-            if not titulo or not titulo.strip():
+            titulo_limpo = titulo.strip() if titulo else ""
+            if not titulo_limpo:
                 logger.warning("Tentativa de criar atividade sem título")
                 return None
-            
+
             dto = AtividadeAgendaDTO(
                 id=None,
-                titulo=titulo.strip(),
+                titulo=titulo_limpo,
                 dia_semana=dia_semana.value,
                 horario=horario,
                 prioridade=prioridade,
@@ -394,7 +569,7 @@ class ServicoAgenda:
             )
             
             id_atividade = self.repositorio.adicionar_atividade_agenda(dto)
-            logger.info(f"Atividade '{titulo}' criada com ID {id_atividade}")
+            logger.info("Atividade '%s' criada com ID %s", titulo, id_atividade)
             return id_atividade
             
         except Exception as e:
@@ -405,7 +580,7 @@ class ServicoAgenda:
         """Atualiza uma atividade existente."""
         try:
             self.repositorio.atualizar_atividade_agenda(atividade)
-            logger.info(f"Atividade {atividade.id} atualizada")
+            logger.info("Atividade %s atualizada", atividade.id)
             return True
         except Exception as e:
             logger.error(f"Erro ao atualizar atividade: {e}")
@@ -415,7 +590,7 @@ class ServicoAgenda:
         """Deleta uma atividade da agenda."""
         try:
             self.repositorio.deletar_atividade_agenda(atividade_id)
-            logger.info(f"Atividade {atividade_id} deletada")
+            logger.info("Atividade %s deletada", atividade_id)
             return True
         except Exception as e:
             logger.error(f"Erro ao deletar atividade: {e}")
@@ -476,54 +651,57 @@ class ServicoSincronizacao:
             if indice_dia is None:
                 return resultado
             
-            data_hoje = date.today().isoformat()
-            
-            # Obter todas as células da grade de horários
-            dados_grade = self.repositorio.carregar_dados_horarios()
-            
-            # Filtrar apenas as atividades do dia atual
-            atividades_hoje = [
-                (horario, atividade) 
-                for horario, coluna, atividade in dados_grade 
-                if coluna == indice_dia and atividade and atividade.strip()
-            ]
-            
-            logger.info(f"Sincronizando {len(atividades_hoje)} atividades para {dia_atual.value}")
-            
+            data_hoje = hoje_iso()
+
+            # Obter só as células preenchidas do dia atual (filtro no SQL)
+            atividades_hoje = self.repositorio.carregar_dados_horarios_por_coluna(indice_dia)
+
+            logger.info("Sincronizando %s atividades para %s", len(atividades_hoje), dia_atual.value)
+
+            # Uma única consulta ao dia e teste de duplicata por pertinência:
+            # duplicata = mesmo título criado hoje ou vindo da agenda
+            titulos_existentes = self._carregar_titulos_existentes(dia_atual, data_hoje)
+
+            # Montar os DTOs das tarefas novas e gravar tudo em uma transação
+            novas_tarefas = []
             for horario, atividade in atividades_hoje:
                 try:
                     # Verificar se já existe tarefa com mesmo título hoje
-                    if self._tarefa_ja_existe_hoje(dia_atual, horario, atividade, data_hoje):
+                    titulo = f"[{horario}] {atividade}"
+                    if titulo in titulos_existentes:
                         resultado['ignoradas'] += 1
                         continue
-                    
+
                     # Extrair prioridade do texto (formato [P0], [P1], etc)
-                    prioridade = self._extrair_prioridade(atividade)
-                    
-                    # Criar nova tarefa no Kanban
-                    titulo = f"[{horario}] {atividade}"
-                    id_tarefa = self.servico_tarefas.criar_tarefa(
+                    prioridade = ExtratorMetadados.extrair_prioridade(atividade)
+
+                    novas_tarefas.append(TarefaDTO(
+                        id=None,
                         titulo=titulo,
-                        dia=dia_atual,
-                        status=StatusTarefa.FAZER,
+                        dia=dia_atual.value,
+                        status=StatusTarefa.FAZER.value,
                         prioridade=prioridade,
                         origem="agenda",
-                        atividade_origem_id=None
-                    )
-                    
-                    if id_tarefa:
-                        resultado['criadas'] += 1
-                        logger.info(f"Tarefa criada: {titulo} (ID: {id_tarefa}, P{prioridade})")
-                    else:
-                        resultado['erros'].append(f"Falha ao criar tarefa: {atividade}")
-                        
+                        atividade_origem_id=None,
+                        data_criacao=data_hoje
+                    ))
+                    titulos_existentes.add(titulo)
+
                 except Exception as e:
                     erro_msg = f"Erro ao processar atividade '{atividade}': {e}"
                     logger.error(erro_msg)
                     resultado['erros'].append(erro_msg)
+
+            if novas_tarefas:
+                ids_criados = self.servico_tarefas.criar_tarefas_em_lote(novas_tarefas)
+                resultado['criadas'] = len(ids_criados)
+                if len(ids_criados) != len(novas_tarefas):
+                    resultado['erros'].append(
+                        f"Falha ao criar {len(novas_tarefas) - len(ids_criados)} tarefas em lote"
+                    )
             
-            logger.info(f"Sincronização concluída: {resultado['criadas']} criadas, "
-                       f"{resultado['ignoradas']} ignoradas, {len(resultado['erros'])} erros")
+            logger.info("Sincronização concluída: %s criadas, %s ignoradas, %s erros",
+                        resultado['criadas'], resultado['ignoradas'], len(resultado['erros']))
             
         except Exception as e:
             logger.error(f"Erro na sincronização: {e}")
@@ -533,45 +711,19 @@ class ServicoSincronizacao:
     
     def _obter_indice_dia(self, dia: DiaDaSemana) -> Optional[int]:
         """Retorna o índice da coluna para o dia da semana."""
-        mapeamento = {
-            DiaDaSemana.SEGUNDA: 0,
-            DiaDaSemana.TERCA: 1,
-            DiaDaSemana.QUARTA: 2,
-            DiaDaSemana.QUINTA: 3,
-            DiaDaSemana.SEXTA: 4
-        }
-        return mapeamento.get(dia)
-    
-    def _extrair_prioridade(self, texto: str) -> int:
-        """
-        Extrai a prioridade do texto da atividade.
-        Procura por [P0], [P1], [P2], [P3] no texto.
-        
-        Returns:
-            0-3 representando a prioridade, 3 como padrão
-        """
-        return ExtratorMetadados.extrair_prioridade(texto)
-    
-    def _tarefa_ja_existe_hoje(self, dia: DiaDaSemana, horario: str, atividade: str, data_hoje: str) -> bool:
+        return _INDICE_DIA.get(dia)
+
+    def _carregar_titulos_existentes(self, dia: DiaDaSemana, data_hoje: str) -> set:
         """
-        Verifica se já existe uma tarefa com o mesmo título (horário + atividade) hoje.
+        Carrega de uma vez os títulos do dia que contam como duplicata:
+        criados hoje ou originados da agenda. A projeção é feita no SQL,
+        sem materializar TarefaDTO por linha.
         """
         try:
-            tarefas_do_dia = self.repositorio.obter_por_dia(dia.value)
-            titulo_esperado = f"[{horario}] {atividade}"
-            
-            for tarefa in tarefas_do_dia:
-                # Verificar se tarefa tem mesmo título e foi criada hoje
-                if tarefa.titulo == titulo_esperado:
-                    if hasattr(tarefa, 'data_criacao') and tarefa.data_criacao == data_hoje:
-                        return True
-                    # Se não tem data_criacao mas tem mesmo título, considerar duplicata
-                    if tarefa.origem == "agenda":
-                        return True
-            return False
+            return self.repositorio.obter_titulos_por_dia_e_data(dia.value, data_hoje)
         except Exception as e:
             logger.warning(f"Erro ao verificar duplicatas: {e}")
-            return False
+            return set()
     
     def sincronizar_async(
         self,
@@ -585,7 +737,14 @@ class ServicoSincronizacao:
             callback_sucesso: Função chamada com resultado da sincronização
             callback_erro: Função chamada em caso de erro
         """
-        from workers import executar_async
+        # Fim de semana: nada a sincronizar — resolve direto, sem agendar
+        # worker no pool para um no-op
+        if obter_dia_semana_atual() is None:
+            logger.info("Hoje é fim de semana - sincronização ignorada")
+            if callback_sucesso:
+                callback_sucesso({'criadas': 0, 'ignoradas': 0, 'erros': []})
+            return
+
         executar_async(
             self.sincronizar_agenda_para_kanban,
             callback_sucesso,
@@ -3,6 +3,7 @@ Módulo de workers para execução assíncrona de tarefas.
 Implementa multithreading para evitar travamentos na UI.
 """
 import logging
+import time
 from typing import Callable, Any, Optional
 from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot, QThreadPool
 
@@ -11,45 +12,62 @@ from constantes import MAX_THREADS_POOL
 logger = logging.getLogger(__name__)
 
 
-class WorkerSignals(QObject):
-    """Sinais para comunicação entre worker e thread principal."""
-    
-    finalizado = pyqtSignal(object)  # Emitido com o resultado
-    erro = pyqtSignal(Exception)     # Emitido com a exceção
-    progresso = pyqtSignal(int)      # Emitido com percentual de progresso
+class _Despachante(QObject):
+    """
+    QObject único para devolver callbacks à thread principal.
 
+    Criado no import do módulo (thread principal); o emit vindo de uma
+    thread do pool vira conexão enfileirada automaticamente, então o
+    callback roda no event loop principal sem alocar um QObject por tarefa.
+    """
 
-class TarefaWorker(QRunnable):
-    """Worker genérico para executar tarefas em background."""
-    
-    def __init__(self, funcao: Callable, *args, **kwargs):
-        """
-        Inicializa o worker.
-        
-        Args:
-            funcao: Função a ser executada em background
-            *args: Argumentos posicionais da função
-            **kwargs: Argumentos nomeados da função
-        """
+    chamar = pyqtSignal(object, object)  # (callback, valor)
+
+    def __init__(self):
+        super().__init__()
+        self.chamar.connect(self._executar)
+
+    def _executar(self, callback: Callable, valor: Any) -> None:
+        callback(valor)
+
+
+_DESPACHANTE = _Despachante()
+
+
+class TarefaWorkerLite(QRunnable):
+    """
+    Worker leve sem sinais próprios: guarda os callbacks e despacha a
+    conclusão pelo _DESPACHANTE compartilhado. Evita construir e conectar
+    um WorkerSignals por submissão no caminho comum dos serviços.
+    """
+
+    def __init__(
+        self,
+        funcao: Callable,
+        callback_sucesso: Optional[Callable[[Any], None]],
+        callback_erro: Optional[Callable[[Exception], None]],
+        *args,
+        **kwargs
+    ):
         super().__init__()
         self.funcao = funcao
+        self.callback_sucesso = callback_sucesso
+        self.callback_erro = callback_erro
         self.args = args
         self.kwargs = kwargs
-        self.sinais = WorkerSignals()
-        # Não usar auto-delete para garantir que sinais não sejam deletados
-        self.setAutoDelete(False)
-    
+
     @pyqtSlot()
     def run(self) -> None:
-        """Executa a tarefa e emite sinais apropriados."""
+        """Executa a tarefa e despacha o callback pela thread principal."""
         try:
-            logger.debug(f"Iniciando execução de {self.funcao.__name__}")
             resultado = self.funcao(*self.args, **self.kwargs)
-            self.sinais.finalizado.emit(resultado)
-            logger.debug(f"Execução de {self.funcao.__name__} concluída")
         except Exception as e:
             logger.error(f"Erro em {self.funcao.__name__}: {e}")
-            self.sinais.erro.emit(e)
+            if self.callback_erro:
+                _DESPACHANTE.chamar.emit(self.callback_erro, e)
+        else:
+            if self.callback_sucesso:
+                _DESPACHANTE.chamar.emit(self.callback_sucesso, resultado)
 
 
 class GerenciadorThreads:
@@ -64,69 +82,76 @@ class GerenciadorThreads:
         return cls._instancia
     
     def __init__(self):
-        """Inicializa o pool de threads."""
+        """Inicializa os pools de threads."""
         if not hasattr(self, '_inicializado'):
-            self.pool = QThreadPool.globalInstance()
-            self.pool.setMaxThreadCount(MAX_THREADS_POOL)
+            # Pools separados por tipo de trabalho: as consultas/gravações
+            # SQLite (I/O) não disputam vaga com trabalho de CPU, evitando
+            # que uma sincronização longa atrase consultas disparadas pela UI
+            self.pool_io = QThreadPool()
+            self.pool_io.setMaxThreadCount(MAX_THREADS_POOL * 2)
+            self.pool_cpu = QThreadPool()
+            self.pool_cpu.setMaxThreadCount(MAX_THREADS_POOL)
             self._inicializado = True
-            self._workers_ativos = []  # Manter referência aos workers
-            logger.info(f"GerenciadorThreads inicializado com {self.pool.maxThreadCount()} threads")
-    
+            logger.info(
+                f"GerenciadorThreads inicializado com {self.pool_io.maxThreadCount()} threads "
+                f"de I/O e {self.pool_cpu.maxThreadCount()} de CPU"
+            )
+
+    def _escolher_pool(self, tipo: str) -> QThreadPool:
+        """Retorna o pool adequado ao tipo de trabalho ('io' ou 'cpu')."""
+        return self.pool_cpu if tipo == "cpu" else self.pool_io
+
     def executar_async(
         self,
         funcao: Callable,
         callback_sucesso: Optional[Callable[[Any], None]] = None,
         callback_erro: Optional[Callable[[Exception], None]] = None,
         *args,
+        tipo: str = "io",
         **kwargs
     ) -> None:
         """
         Executa uma função de forma assíncrona.
-        
+
         Args:
             funcao: Função a ser executada
             callback_sucesso: Função chamada com o resultado em caso de sucesso
             callback_erro: Função chamada com a exceção em caso de erro
             *args: Argumentos para a função
+            tipo: Tipo de trabalho ('io' para banco/arquivos, 'cpu' para cálculo)
             **kwargs: Argumentos nomeados para a função
         """
-        worker = TarefaWorker(funcao, *args, **kwargs)
-        
-        if callback_sucesso:
-            worker.sinais.finalizado.connect(callback_sucesso)
-        
-        if callback_erro:
-            worker.sinais.erro.connect(callback_erro)
-        
-        # Limpar workers finalizados para evitar acúmulo de memória
-        def limpar_worker():
-            if worker in self._workers_ativos:
-                self._workers_ativos.remove(worker)
-        
-        worker.sinais.finalizado.connect(limpar_worker)
-        worker.sinais.erro.connect(limpar_worker)
-        
-        # Manter referência ao worker enquanto executa
-        self._workers_ativos.append(worker)
-        
-        self.pool.start(worker)
-        logger.debug(f"Worker para {funcao.__name__} adicionado ao pool")
-    
+        # Caminho rápido: callbacks simples dispensam o WorkerSignals por
+        # tarefa — o pool segura a referência do runnable até concluir
+        worker = TarefaWorkerLite(funcao, callback_sucesso, callback_erro, *args, **kwargs)
+        self._escolher_pool(tipo).start(worker)
+        logger.debug("Worker para %s adicionado ao pool de %s", funcao.__name__, tipo)
+
     def threads_ativas(self) -> int:
-        """Retorna o número de threads ativas."""
-        return self.pool.activeThreadCount()
-    
+        """Retorna o número de threads ativas nos dois pools."""
+        return self.pool_io.activeThreadCount() + self.pool_cpu.activeThreadCount()
+
     def aguardar_conclusao(self, timeout_ms: int = -1) -> bool:
         """
         Aguarda a conclusão de todas as tarefas.
-        
+
         Args:
             timeout_ms: Timeout em milissegundos (-1 para infinito)
-            
+
         Returns:
             True se todas as tarefas foram concluídas, False se timeout
         """
-        return self.pool.waitForDone(timeout_ms)
+        if timeout_ms < 0:
+            concluido_io = self.pool_io.waitForDone(-1)
+            return self.pool_cpu.waitForDone(-1) and concluido_io
+
+        # Orçamento único repartido entre os dois pools: a segunda espera
+        # recebe só o que sobrou, em vez de reaplicar o timeout inteiro
+        inicio = time.monotonic()
+        concluido_io = self.pool_io.waitForDone(timeout_ms)
+        restante = timeout_ms - int((time.monotonic() - inicio) * 1000)
+        concluido_cpu = self.pool_cpu.waitForDone(max(0, restante))
+        return concluido_io and concluido_cpu
 
 
 # Função helper para uso simplificado
@@ -135,17 +160,19 @@ def executar_async(
     callback_sucesso: Optional[Callable[[Any], None]] = None,
     callback_erro: Optional[Callable[[Exception], None]] = None,
     *args,
+    tipo: str = "io",
     **kwargs
 ) -> None:
     """
     Atalho para executar função de forma assíncrona.
-    
+
     Args:
         funcao: Função a ser executada
         callback_sucesso: Callback para sucesso
         callback_erro: Callback para erro
         *args: Argumentos da função
+        tipo: Tipo de trabalho ('io' para banco/arquivos, 'cpu' para cálculo)
         **kwargs: Argumentos nomeados da função
     """
     gerenciador = GerenciadorThreads()
-    gerenciador.executar_async(funcao, callback_sucesso, callback_erro, *args, **kwargs)
+    gerenciador.executar_async(funcao, callback_sucesso, callback_erro, *args, tipo=tipo, **kwargs)